@@ -1,17 +1,33 @@
 import argparse
 import logging
+import re
 import sys
 from pathlib import Path
-from typing import Optional
 
-from ..config.processing import EncodingConfig, ProcessingConfig, ProcessingOptions
 from ..enums import AudioCodec, VideoCodec
-from ..project.processor import Project
 from ..utils.logging import configure_logging
 
 # Setup module logger
 logger = logging.getLogger(__name__)
 
+_YEAR_RE = re.compile(r"^\d{4}$")
+
+VIDEO_CODEC_DESCRIPTIONS = {
+    "H264": "Standard H.264/AVC (libx264). Good compression, widely compatible",
+    "H265": "High Efficiency HEVC (libx265). Better compression, newer devices",
+    "VP9": "Google VP9. Free, good quality, slower encoding",
+    "AV1": "AV1. Excellent compression, very slow encoding",
+    "H264_NVENC": "NVIDIA GPU H.264. Fast, good quality",
+    "H265_NVENC": "NVIDIA GPU H.265. Fast, better compression",
+}
+
+AUDIO_CODEC_DESCRIPTIONS = {
+    "AAC": "Advanced Audio Coding. Standard high-quality audio",
+    "MP3": "MP3 audio. Widely compatible, good compression",
+    "OPUS": "Opus audio. Excellent quality, modern codec",
+    "VORBIS": "Vorbis audio. Free format, good quality",
+}
+
 
 def create_codec_help(codec_enum, descriptions):
     """Create formatted help text for codec choices."""
@@ -27,25 +43,9 @@ def create_codec_help(codec_enum, descriptions):
     return "\n".join(help_lines)
 
 
-def _get_codec_descriptions():
-    """Get descriptions for codec choices."""
-    VIDEO_CODEC_DESCRIPTIONS = {
-        "H264": "Standard H.264/AVC (libx264). Good compression, widely compatible",
-        "H265": "High Efficiency HEVC (libx265). Better compression, newer devices",
-        "VP9": "Google VP9. Free, good quality, slower encoding",
-        "AV1": "AV1. Excellent compression, very slow encoding",
-        "H264_NVENC": "NVIDIA GPU H.264. Fast, good quality",
-        "H265_NVENC": "NVIDIA GPU H.265. Fast, better compression",
-    }
-
-    AUDIO_CODEC_DESCRIPTIONS = {
-        "AAC": "Advanced Audio Coding. Standard high-quality audio",
-        "MP3": "MP3 audio. Widely compatible, good compression",
-        "OPUS": "Opus audio. Excellent quality, modern codec",
-        "VORBIS": "Vorbis audio. Free format, good quality",
-    }
-
-    return VIDEO_CODEC_DESCRIPTIONS, AUDIO_CODEC_DESCRIPTIONS
+# Built once at import; the stock RawTextHelpFormatter prints them as they are
+_VIDEO_CODEC_HELP = create_codec_help(VideoCodec, VIDEO_CODEC_DESCRIPTIONS)
+_AUDIO_CODEC_HELP = create_codec_help(AudioCodec, AUDIO_CODEC_DESCRIPTIONS)
 
 
 def parse_args() -> argparse.Namespace:
@@ -109,13 +109,11 @@ def parse_args() -> argparse.Namespace:
         help="GPU encoding quality (0-51, lower is better, default: 20)",
     )
 
-    video_descs, audio_descs = _get_codec_descriptions()
-
     parser.add_argument(
         "--video-codec",
         choices=[codec.name for codec in VideoCodec],
         default="H264",
-        help=create_codec_help(VideoCodec, video_descs),
+        help=_VIDEO_CODEC_HELP,
         metavar="CODEC",
     )
 
@@ -123,7 +121,7 @@ def parse_args() -> argparse.Namespace:
         "--audio-codec",
         choices=[codec.name for codec in AudioCodec],
         default="AAC",
-        help=create_codec_help(AudioCodec, audio_descs),
+        help=_AUDIO_CODEC_HELP,
         metavar="CODEC",
     )
 
@@ -144,12 +142,14 @@ def validate_args(args: argparse.Namespace) -> None:
         raise ValueError(f"Input directory does not exist: {input_path}")
 
     # Validate years
-    years = [y.strip() for y in args.years.split(",")]
+    years = list(map(str.strip, args.years.split(",")))
     if not years:
         raise ValueError("No years specified")
-    for year in years:
-        if not year.isdigit() or len(year) != 4:
-            raise ValueError(f"Invalid year: {year}")
+    if not all(_YEAR_RE.match(y) for y in years):
+        invalid = next(y for y in years if not _YEAR_RE.match(y))
+        raise ValueError(f"Invalid year: {invalid}")
+    # Stash the parsed list so process_videos_by_years doesn't split again
+    args._years = years
 
     # Check thread count
     if args.threads < 1:
@@ -173,6 +173,11 @@ def validate_args(args: argparse.Namespace) -> None:
 
 def process_videos_by_years(args: argparse.Namespace) -> None:
     """Process videos according to arguments."""
+    # Imported here so --help and argument errors don't pay for loading the
+    # processing pipeline (PIL and the clip/movie processors)
+    from ..config.processing import EncodingConfig, ProcessingConfig, ProcessingOptions
+    from ..project.processor import Project
+
     # Parse target resolution
     width, height = map(int, args.target_resolution.split("x"))
 
@@ -180,7 +185,7 @@ def process_videos_by_years(args: argparse.Namespace) -> None:
     config = ProcessingConfig(
         input_path=Path(args.input_dir),
         output_path=Path(args.output_dir),
-        years=[y.strip() for y in args.years.split(",")],
+        years=args._years,
         encoding=EncodingConfig(
             video_codec=VideoCodec[args.video_codec],
             audio_codec=AudioCodec[args.audio_codec],
@@ -201,14 +206,13 @@ def process_videos_by_years(args: argparse.Namespace) -> None:
 
     # Create temp directory
     logger.debug(f"Using temp directory: {config.options.temp_dir}")
-    if not config.options.temp_dir.exists():
+    if not config.options.dry_run and not config.options.temp_dir.exists():
         config.options.temp_dir.mkdir(parents=True)
 
     # Initialize video processor
     project_processor = Project(config)
 
-    for year in config.years:
-        project_processor.process(year)
+    project_processor.process_years(config.years)
 
 
 def main() -> int:
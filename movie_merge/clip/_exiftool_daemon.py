@@ -0,0 +1,162 @@
+"""Long-lived exiftool process for reading dates one file at a time."""
+
+import atexit
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..ffmepg.wrapper import find_executable
+
+logger = logging.getLogger(__name__)
+
+# Matches the format parsed by Clip when reading exiftool dates
+EXIFTOOL_DATE_FORMAT = "%Y-%m-%d %H:%M:%S%z"
+
+# Options applied to every file, both by the daemon and by one-shot runs
+EXIFTOOL_DATE_ARGS = ["-d", EXIFTOOL_DATE_FORMAT, "-s3", "-DateTimeOriginal"]
+
+_daemon: Optional["ExiftoolDaemon"] = None
+_daemon_lock = threading.Lock()
+
+
+class ExiftoolDaemon:
+    """Wrapper around ``exiftool -stay_open True -@ -``.
+
+    Starting exiftool loads the Perl interpreter and its modules, which costs far more
+    than reading a single file. The daemon starts exiftool once and sends one argfile
+    block per file, terminated by ``-execute{n}``, then reads until ``{ready{n}}``.
+    """
+
+    def __init__(self, executable: str):
+        """Start the exiftool process.
+
+        Args:
+            executable: Path to the exiftool executable
+
+        Raises:
+            OSError: If exiftool cannot be started
+        """
+        self._process = subprocess.Popen(
+            [
+                executable,
+                "-stay_open",
+                "True",
+                "-@",
+                "-",
+                "-common_args",
+                *EXIFTOOL_DATE_ARGS,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        self._executable = executable
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    @classmethod
+    def instance(cls) -> Optional["ExiftoolDaemon"]:
+        """Get the shared daemon, starting it on first use.
+
+        Returns:
+            ExiftoolDaemon instance, or None if exiftool is not available
+        """
+        global _daemon
+        with _daemon_lock:
+            if _daemon is None or not _daemon.is_running():
+                executable = find_executable("exiftool")
+                if not executable:
+                    return None
+                try:
+                    _daemon = cls(executable)
+                except OSError as e:
+                    logger.debug(f"Failed to start exiftool: {e}")
+                    return None
+                atexit.register(_daemon.close)
+            return _daemon
+
+    def is_running(self) -> bool:
+        """Check whether the exiftool process is still alive."""
+        return self._process.poll() is None
+
+    def get_datetime_original(self, path: Path) -> Optional[str]:
+        """Read the DateTimeOriginal tag of a file.
+
+        Args:
+            path: File to read
+
+        Returns:
+            Date string formatted with EXIFTOOL_DATE_FORMAT, or None if the file has no date
+        """
+        if "\n" in str(path) or "\r" in str(path):
+            # The argfile is line based, so the path would split into several arguments and
+            # desync the {ready} framing. Pass it on a command line of its own instead.
+            return read_datetime_original(self._executable, path)
+
+        with self._lock:
+            self._counter += 1
+            ready = f"{{ready{self._counter}}}"
+            try:
+                self._process.stdin.write(f"{path}\n-execute{self._counter}\n")
+                self._process.stdin.flush()
+
+                lines = []
+                while True:
+                    line = self._process.stdout.readline()
+                    if not line:
+                        raise OSError("exiftool exited unexpectedly")
+                    line = line.strip()
+                    if line == ready:
+                        break
+                    lines.append(line)
+            except OSError as e:
+                logger.debug(f"exiftool request failed for {path}: {e}")
+                self._process.kill()
+                return None
+
+        return lines[0] if lines and lines[0] else None
+
+    def close(self) -> None:
+        """Ask exiftool to exit, killing it if it does not."""
+        with self._lock:
+            if not self.is_running():
+                return
+            try:
+                self._process.stdin.write("-stay_open\nFalse\n")
+                self._process.stdin.flush()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+
+
+def read_datetime_original(executable: str, path: Path) -> Optional[str]:
+    """Read the DateTimeOriginal tag of a file with a one-shot exiftool run.
+
+    Args:
+        executable: Path to the exiftool executable
+        path: File to read
+
+    Returns:
+        Date string formatted with EXIFTOOL_DATE_FORMAT, or None if the file has no date
+    """
+    try:
+        result = subprocess.run(
+            [executable, *EXIFTOOL_DATE_ARGS, str(path)],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.debug(f"exiftool request failed for {path}: {e}")
+        return None
+
+    lines = result.stdout.splitlines()
+    if not lines or not lines[0].strip():
+        return None
+    return lines[0].strip()
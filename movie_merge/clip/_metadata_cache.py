@@ -0,0 +1,112 @@
+"""Persistent clip metadata cache keyed by file path, mtime and size."""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = ".metadata_cache.json"
+
+_caches: Dict[Path, "MetadataCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class MetadataCache:
+    """JSON-backed cache of ffprobe output and extracted clip metadata.
+
+    Entries are stored as ``{path: {"mtime": st_mtime_ns, "size": st_size, "probe": {...},
+    "metadata": {...}}}`` and are only returned while the file's mtime and size still match.
+    Changes are kept in memory and written by flush(), which also runs at exit.
+    """
+
+    def __init__(self, cache_file: Path):
+        """Initialize cache and load existing entries from disk.
+
+        Args:
+            cache_file: Path to the JSON cache file
+        """
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cache entries from disk, ignoring missing or corrupt files."""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable metadata cache {self.cache_file}: {e}")
+        return {}
+
+    def get(self, path: Path, stats: os.stat_result, key: str = "probe") -> Optional[Any]:
+        """Return a cached value if the file is unchanged since it was cached.
+
+        Args:
+            path: File the value belongs to
+            stats: Current stat result of the file
+            key: Which value to return ("probe" or "metadata")
+        """
+        with self._lock:
+            entry = self._entries.get(str(path))
+        if entry and entry.get("mtime") == stats.st_mtime_ns and entry.get("size") == stats.st_size:
+            return entry.get(key)
+        return None
+
+    def put(self, path: Path, stats: os.stat_result, **values: Any) -> None:
+        """Store values for a file, replacing the entry if the file has changed."""
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if (
+                entry is None
+                or entry.get("mtime") != stats.st_mtime_ns
+                or entry.get("size") != stats.st_size
+            ):
+                entry = {"mtime": stats.st_mtime_ns, "size": stats.st_size}
+                self._entries[str(path)] = entry
+            entry.update(values)
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Atomically write the cache to disk if it has changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            try:
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(temp_file, self.cache_file)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to write metadata cache {self.cache_file}: {e}")
+
+
+def get_metadata_cache(cache_dir: Optional[Path]) -> Optional[MetadataCache]:
+    """Get the shared metadata cache for a directory.
+
+    Args:
+        cache_dir: Directory holding the cache file (usually the temp directory)
+
+    Returns:
+        MetadataCache instance, or None if no directory is configured
+    """
+    if cache_dir is None:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            cache = MetadataCache(cache_dir / CACHE_FILE)
+            _caches[cache_dir] = cache
+            atexit.register(cache.flush)
+        return cache
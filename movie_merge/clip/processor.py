@@ -1,25 +1,116 @@
 """Handles operations on individual video files."""
 
+import hashlib
+import json
 import logging
+import os
 import subprocess
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-from zoneinfo import ZoneInfo
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from movie_merge.constants import UNSUPPORTED_VIDEO_EXTENSIONS
+from movie_merge.constants import MP4_AUDIO_CODECS, UNSUPPORTED_VIDEO_EXTENSIONS
 
 from ..config.directory import DirectoryConfig
 from ..config.processing import ProcessingConfig
-from ..ffmepg.wrapper import FFmpegWrapper
+from ..ffmepg.wrapper import FFmpegWrapper, find_executable, get_default_ffmpeg
 from ..utils.logging import LoggingContext
+from ._exiftool_daemon import EXIFTOOL_DATE_FORMAT, ExiftoolDaemon
+from ._metadata_cache import get_metadata_cache
 from .title import TitleCardConfig, TitleCardGenerator
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# ffprobe fields read by Clip._extract_metadata; everything else (tags, side data,
+# chapters) is left out of the probe output
+CLIP_PROBE_ENTRIES = (
+    "stream=codec_type,codec_name,width,height,bit_rate,avg_frame_rate,r_frame_rate,"
+    "channels,sample_rate:format=duration,size,format_name"
+)
+
+# ISO base media files (MP4/MOV) keep all stream parameters in the moov header, so ffprobe
+# doesn't need to read and decode its default 5 MB / 5 s of packets to find them. The
+# demuxer is not forced with -f mov: a mislabelled file (e.g. MPEG-TS saved as .mp4) would
+# then fail to probe at all, while format detection only reads the first few KB. -fflags
+# +fastseek is left out too, since it only affects seeking, not probing.
+QUICK_PROBE_EXTENSIONS = frozenset({".mp4", ".mov", ".m4v"})
+QUICK_PROBE_ARGS = ["-probesize", "500000", "-analyzeduration", "500000"]
+
+# ffprobe fields that can change when convert_to_mp4 re-encodes a clip
+CONVERTED_PROBE_ENTRIES = "stream=codec_type,codec_name,bit_rate:format=duration,size,format_name"
+
+# TitleCardGenerator keeps per-render state, so reuse one instance per thread
+# rather than sharing it across concurrently processed movies
+_title_generators = threading.local()
+
+# "original" directories already created this run, so converting many clips from one
+# directory only creates it once
+_ensured_dirs: Set[Path] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _parse_exif_datetime(dt_str: str) -> datetime:
+    """Parse an exiftool date formatted as "%Y-%m-%d %H:%M:%S%z".
+
+    datetime.fromisoformat() accepts this layout directly (including offsets without
+    a colon, e.g. "-1000") and avoids the much slower _strptime machinery.
+
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    return datetime.fromisoformat(dt_str.strip())
+
+
+def _parse_fps(rate_str: str) -> float:
+    """Parse an ffprobe frame rate such as "30000/1001", returning 0.0 if invalid."""
+    num, sep, den = rate_str.partition("/")
+    if not sep or not num.isdecimal() or not den.isdecimal():
+        return 0.0
+    den_value = int(den)
+    return int(num) / den_value if den_value else 0.0
+
+
+def _find_streams(
+    streams: List[Dict[str, Any]],
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Find the first video and audio stream of an ffprobe stream list in one pass."""
+    video_stream = audio_stream = None
+    for stream in streams:
+        codec_type = stream.get("codec_type")
+        if codec_type == "video" and video_stream is None:
+            video_stream = stream
+        elif codec_type == "audio" and audio_stream is None:
+            audio_stream = stream
+        if video_stream is not None and audio_stream is not None:
+            break
+    return video_stream, audio_stream
+
+
+def probe_args(path: Path) -> Optional[List[str]]:
+    """Get the ffprobe input options to use for a clip, if any."""
+    return QUICK_PROBE_ARGS if path.suffix.lower() in QUICK_PROBE_EXTENSIONS else None
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a directory unless it was already created this run."""
+    with _ensured_dirs_lock:
+        if directory not in _ensured_dirs:
+            directory.mkdir(exist_ok=True)
+            _ensured_dirs.add(directory)
+
+
+def _get_title_generator() -> TitleCardGenerator:
+    """Get the title card generator for the current thread."""
+    generator = getattr(_title_generators, "generator", None)
+    if generator is None:
+        generator = TitleCardGenerator()
+        _title_generators.generator = generator
+    return generator
+
+
+@dataclass(slots=True)
 class ClipMetadata:
     """Container for clip metadata."""
 
@@ -44,23 +135,17 @@ class ClipMetadata:
 
     def to_dict(self) -> dict:
         """Convert metadata to dictionary."""
-        return {
-            "creation_date": self.creation_date.isoformat(),
-            "name": self.name,
-            "extension": self.extension,
-            "duration": self.duration,
-            "frame_rate": self.frame_rate,
-            "video_codec": self.video_codec,
-            "width": self.width,
-            "height": self.height,
-            "video_bitrate": self.video_bitrate,
-            "audio_codec": self.audio_codec,
-            "audio_channels": self.audio_channels,
-            "audio_bitrate": self.audio_bitrate,
-            "audio_sample_rate": self.audio_sample_rate,
-            "file_size": self.file_size,
-            "format": self.format,
-        }
+        data = {name: getattr(self, name) for name in _CLIP_METADATA_FIELDS}
+        data["creation_date"] = self.creation_date.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ClipMetadata":
+        """Create metadata from a dictionary produced by to_dict()."""
+        return cls(**{**data, "creation_date": datetime.fromisoformat(data["creation_date"])})
+
+
+_CLIP_METADATA_FIELDS = tuple(f.name for f in fields(ClipMetadata))
 
 
 class Clip:
@@ -73,6 +158,10 @@ class Clip:
         dir_config: DirectoryConfig,
         is_title: bool = False,
         extract_metadata: bool = True,
+        probe_data: Optional[Dict[str, Any]] = None,
+        exif_dates: Optional[Dict[Path, Optional[datetime]]] = None,
+        ffmpeg: Optional[FFmpegWrapper] = None,
+        stat_result: Optional[os.stat_result] = None,
     ):
         """Initialize clip processor.
 
@@ -82,26 +171,44 @@ class Clip:
             dir_config: Directory configuration
             is_title: Whether this clip should have a title card
             extract_metadata: Whether to extract metadata immediately (default: True)
+            probe_data: Prefetched ffprobe output for input_file, used instead of probing
+            exif_dates: Prefetched exiftool dates from prewarm_exif(), used instead of
+                running exiftool for this clip
+            ffmpeg: FFmpegWrapper to use (defaults to the shared instance)
+            stat_result: Existing stat result for input_file, used instead of stat'ing it again
         """
-        self._ffmpeg: FFmpegWrapper = FFmpegWrapper()
-        self.path: Path = input_file
+        self._ffmpeg: FFmpegWrapper = ffmpeg or get_default_ffmpeg()
+        try:
+            self._set_path(input_file, stat_result)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Video file not found: {input_file}")
         self.is_title: bool = is_title
         self.proc_config: ProcessingConfig = proc_config
         self.dir_config: DirectoryConfig = dir_config
+        self._probe_data: Optional[Dict[str, Any]] = probe_data
+        self._exif_dates: Optional[Dict[Path, Optional[datetime]]] = exif_dates
 
         # Initialize metadata - will be set later if extract_metadata is True
         self.metadata: Optional[ClipMetadata] = None
 
         if extract_metadata:
-            self.metadata = self._extract_metadata()
+            self.extract_metadata_if_needed()
 
-        if not self.path.exists():
-            raise FileNotFoundError(f"Video file not found: {self.path}")
+    def _set_path(self, path: Path, stat_result: Optional[os.stat_result] = None) -> None:
+        """Point the clip at a file and cache its stat result and lowercased suffix.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        self._stat: os.stat_result = stat_result or os.stat(path)
+        self._suffix_lower: str = path.suffix.lower()
+        self.path: Path = path
 
     def extract_metadata_if_needed(self) -> None:
         """Extract metadata if not already done."""
         if self.metadata is None:
-            self.metadata = self._extract_metadata()
+            self.metadata = self._extract_metadata(probe_data=self._probe_data)
+            self._probe_data = None
 
     def to_dict(self) -> dict:
         """Convert clip to dictionary."""
@@ -112,32 +219,78 @@ class Clip:
             "metadata": self.metadata.to_dict() if self.metadata else None,
         }
 
-    def _extract_datetime_from_exiftool(self, path: Optional[Path] = None) -> Optional[datetime]:
-        file_path = path or self.path
-        logger.debug(f"Extracting datetime from exiftool: {file_path}")
+    @staticmethod
+    def prewarm_exif(paths: List[Path]) -> Dict[Path, Optional[datetime]]:
+        """Extract DateTimeOriginal for many files with a single exiftool run.
+
+        Args:
+            paths: Video files to read
+
+        Returns:
+            Dictionary mapping every path to its datetime, or None if the file has none.
+            Paths containing line breaks are left out, since the argfile is line based;
+            those clips read their date on their own. Empty if exiftool could not be run.
+        """
+        exiftool = find_executable("exiftool")
+        paths = [p for p in paths if "\n" not in str(p) and "\r" not in str(p)]
+        if not paths or not exiftool:
+            return {}
+
         try:
+            # File names go through an argfile on stdin so large directories can't
+            # exceed the command line length limit
             result = subprocess.run(
-                ["exiftool", "-DateTimeOriginal", "-d", "%Y-%m-%d %H:%M:%S%z", str(file_path)],
+                [exiftool, "-j", "-DateTimeOriginal", "-d", EXIFTOOL_DATE_FORMAT, "-@", "-"],
+                input="\n".join(str(p) for p in paths),
                 capture_output=True,
                 text=True,
-                check=True,
+                encoding="utf-8",
             )
+            entries = json.loads(result.stdout) if result.stdout else []
+        except Exception as e:
+            logger.debug("Failed to batch extract exiftool datetimes: %s", e)
+            return {}
+
+        dates: Dict[Path, Optional[datetime]] = {p: None for p in paths}
+        by_name = {str(p): p for p in paths}
+        for entry in entries:
+            path = by_name.get(entry.get("SourceFile", ""))
+            dt_str = entry.get("DateTimeOriginal")
+            if path is None or not isinstance(dt_str, str):
+                continue
+            try:
+                dates[path] = _parse_exif_datetime(dt_str)
+            except ValueError:
+                logger.debug("Unparseable exiftool datetime for %s: %s", path, dt_str)
 
-            if "Date/Time Original" in result.stdout:
-                # Expected format: "Date/Time Original: 2017:08:17 20:55:57-1000"
-                dt_str = result.stdout.split(": ")[1].strip()
-                logger.debug(f"Extracted datetime: {dt_str}")
-                return datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S%z")
+        return dates
 
-        except Exception as e:
-            logger.debug(f"Failed to extract exiftool datetime: {e}")
-        return None
+    def _extract_datetime_from_exiftool(self, path: Optional[Path] = None) -> Optional[datetime]:
+        file_path = path or self.path
+        daemon = ExiftoolDaemon.instance()
+        if daemon is None:
+            return None
+
+        logger.debug("Extracting datetime from exiftool: %s", file_path)
+        dt_str = daemon.get_datetime_original(file_path)
+        if dt_str is None:
+            return None
 
-    def _extract_metadata(self, path: Optional[Path] = None) -> ClipMetadata:
+        logger.debug("Extracted datetime: %s", dt_str)
+        try:
+            return _parse_exif_datetime(dt_str)
+        except ValueError as e:
+            logger.debug("Failed to extract exiftool datetime: %s", e)
+            return None
+
+    def _extract_metadata(
+        self, path: Optional[Path] = None, probe_data: Optional[Dict[str, Any]] = None
+    ) -> ClipMetadata:
         """Extract metadata from video file.
 
         Args:
             path: Path to video file (defaults to self.path if None)
+            probe_data: Prefetched ffprobe output for the file, skips running ffprobe
 
         Returns:
             ClipMetadata: Extracted metadata
@@ -148,77 +301,81 @@ class Clip:
         file_path = path or self.path
 
         try:
-            # Check if file exists and has non-zero size
-            if not file_path.exists():
-                raise RuntimeError(f"File does not exist: {file_path}")
-
-            if file_path.stat().st_size == 0:
+            # Check if file exists and has non-zero size, reusing the clip's own stat result
+            if file_path == self.path:
+                stats = self._stat
+            else:
+                try:
+                    stats = os.stat(file_path)
+                except FileNotFoundError:
+                    raise RuntimeError(f"File does not exist: {file_path}")
+            if stats.st_size == 0:
                 raise RuntimeError(f"File is empty: {file_path}")
 
-            # Add a small delay to ensure file is fully written/closed
-            import time
-
-            time.sleep(1)
+            # Reuse cached metadata or probe data if the file is unchanged since the last run
+            cache = get_metadata_cache(self.proc_config.options.temp_dir)
+            if cache:
+                cached_metadata = cache.get(file_path, stats, key="metadata")
+                if cached_metadata is not None:
+                    return ClipMetadata.from_dict(cached_metadata)
+            cached_probe = cache.get(file_path, stats, key="probe") if cache else None
 
-            # Try to probe the file
-            try:
-                probe_data = self._ffmpeg.probe(input_file=file_path)
-            except Exception as e:
-                logger.warning(f"Failed to probe file with ffprobe: {e}")
-                # Fall back to basic metadata
-                stats = file_path.stat()
-                return ClipMetadata(
-                    creation_date=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc),
-                    name=file_path.stem,
-                    extension=str(file_path.suffix).lower(),
-                    duration=0.0,
-                    frame_rate=25.0,  # Assume standard rate
-                    video_codec="unknown",
-                    width=1920,  # Assume HD
-                    height=1080,
-                    video_bitrate=0,
-                    audio_codec="unknown",
-                    audio_channels=2,
-                    audio_bitrate=0,
-                    audio_sample_rate=44100,
-                    file_size=stats.st_size,
-                    format="unknown",
-                )
-
-            video_stream = next(
-                (s for s in probe_data["streams"] if s["codec_type"] == "video"), None
-            )
-            audio_stream = next(
-                (s for s in probe_data["streams"] if s["codec_type"] == "audio"), None
-            )
+            if cached_probe is not None:
+                probe_data = cached_probe
+            else:
+                if probe_data is None:
+                    # Try to probe the file
+                    try:
+                        probe_data = self._ffmpeg.probe(
+                            input_file=file_path,
+                            show_entries=CLIP_PROBE_ENTRIES,
+                            extra_args=probe_args(file_path),
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to probe file with ffprobe: {e}")
+                        # Fall back to basic metadata
+                        return ClipMetadata(
+                            creation_date=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc),
+                            name=file_path.stem,
+                            extension=str(file_path.suffix).lower(),
+                            duration=0.0,
+                            frame_rate=25.0,  # Assume standard rate
+                            video_codec="unknown",
+                            width=1920,  # Assume HD
+                            height=1080,
+                            video_bitrate=0,
+                            audio_codec="unknown",
+                            audio_channels=2,
+                            audio_bitrate=0,
+                            audio_sample_rate=44100,
+                            file_size=stats.st_size,
+                            format="unknown",
+                        )
+
+                if cache:
+                    cache.put(file_path, stats, probe=probe_data)
+
+            video_stream, audio_stream = _find_streams(probe_data["streams"])
 
             if not video_stream:
                 raise RuntimeError("No video stream found")
 
-            # Calculate frame rate
-            fps = 0
-            # Try average frame rate first as it's typically more accurate
-            if "avg_frame_rate" in video_stream:
-                try:
-                    num, den = map(int, video_stream["avg_frame_rate"].split("/"))
-                    fps = num / den if den != 0 else 0
-                except (ValueError, ZeroDivisionError):
-                    pass
-
-            # Fall back to real base frame rate if average is not available or invalid
-            if fps == 0 and "r_frame_rate" in video_stream:
-                try:
-                    num, den = map(int, video_stream["r_frame_rate"].split("/"))
-                    fps = num / den if den != 0 else 0
-                except (ValueError, ZeroDivisionError):
-                    pass
+            # Calculate frame rate, preferring the average frame rate as it's typically more
+            # accurate and falling back to the real base frame rate
+            fps = _parse_fps(video_stream.get("avg_frame_rate", "")) or _parse_fps(
+                video_stream.get("r_frame_rate", "")
+            )
 
-            # Extract creation time
-            creation_date = self._extract_datetime_from_exiftool(
-                file_path
-            ) or datetime.fromtimestamp(file_path.stat().st_mtime)
+            # Extract creation time, preferring dates prefetched by prewarm_exif()
+            if self._exif_dates is not None and file_path in self._exif_dates:
+                creation_date = self._exif_dates[file_path]
+            else:
+                creation_date = self._extract_datetime_from_exiftool(file_path)
+            date_from_mtime = creation_date is None
+            if date_from_mtime:
+                creation_date = datetime.fromtimestamp(stats.st_mtime)
 
-            return ClipMetadata(
+            metadata = ClipMetadata(
                 creation_date=creation_date,
                 name=file_path.stem,
                 extension=str(file_path.suffix).lower(),
@@ -235,6 +392,11 @@ class Clip:
                 file_size=int(probe_data["format"].get("size", 0)),
                 format=probe_data["format"].get("format_name", "unknown"),
             )
+            # The cache key doesn't change when exiftool is installed or recovers, so only
+            # cache metadata with a real capture date; the probe output is cached either way
+            if cache and not date_from_mtime:
+                cache.put(file_path, stats, metadata=metadata.to_dict())
+            return metadata
 
         except Exception as e:
             logger.error(f"Failed to extract metadata from {file_path}: {e}")
@@ -243,37 +405,70 @@ class Clip:
     @property
     def needs_processing(self) -> bool:
         """Check if clip needs processing."""
-        return self.path.suffix.lower() in UNSUPPORTED_VIDEO_EXTENSIONS
+        return self._suffix_lower in UNSUPPORTED_VIDEO_EXTENSIONS
+
+    def _converted_metadata(
+        self, output_file: Path, frame_rate: Optional[float] = None
+    ) -> ClipMetadata:
+        """Build metadata for a file produced by convert_to_mp4.
+
+        Creation date, resolution and audio layout are unchanged by the conversion, so
+        only the codec, bitrate and container fields are probed. Skips exiftool and the
+        full metadata extraction.
+
+        Args:
+            output_file: Converted MP4 file
+            frame_rate: New frame rate, if the conversion changed it
+        """
+        probe_data = self._ffmpeg.probe(
+            output_file, show_entries=CONVERTED_PROBE_ENTRIES, extra_args=QUICK_PROBE_ARGS
+        )
+        video_stream, audio_stream = _find_streams(probe_data.get("streams", []))
+        video_stream = video_stream or {}
+        audio_stream = audio_stream or {}
+        format_data = probe_data.get("format", {})
+
+        return replace(
+            self.metadata,
+            name=output_file.stem,
+            extension=".mp4",
+            duration=float(format_data.get("duration", self.metadata.duration)),
+            frame_rate=frame_rate or self.metadata.frame_rate,
+            video_codec=video_stream.get("codec_name", self.proc_config.encoding.video_codec.value),
+            video_bitrate=int(video_stream.get("bit_rate", 0)),
+            audio_codec=audio_stream.get("codec_name", "none"),
+            audio_bitrate=int(audio_stream.get("bit_rate", 0)),
+            file_size=int(format_data.get("size", 0)),
+            format=format_data.get("format_name", "unknown"),
+        )
 
     def convert_to_mp4(self, target_fps: Optional[float] = None) -> "Clip":
         """Convert video file to MP4 format with optional framerate adjustment."""
         # Skip if no processing needed and no framerate change
         if not self.needs_processing and not target_fps:
-            logger.debug(f"Clip {self.path} does not need conversion")
+            logger.debug("Clip %s does not need conversion", self.path)
             return self
 
         # Skip if already MP4 with correct framerate
         needs_framerate_adjustment = (
             target_fps and abs(self.metadata.frame_rate - target_fps) > 0.01
         )
-        is_already_mp4 = self.path.suffix.lower() == ".mp4"
+        is_already_mp4 = self._suffix_lower == ".mp4"
 
         if is_already_mp4 and not needs_framerate_adjustment:
-            logger.debug(f"Clip {self.path} already in MP4 format with correct framerate")
+            logger.debug("Clip %s already in MP4 format with correct framerate", self.path)
             return self
 
         try:
-            logger.debug(f"Converting {self.path} to MP4")
-            # Create 'original' directory if needed
+            logger.debug("Converting %s to MP4", self.path)
+            # Setup output path with .mp4 extension, keeping the original alongside
             original_dir = self.path.parent / "original"
-            original_dir.mkdir(exist_ok=True)
-
-            # Setup output path with .mp4 extension
             output_file = self.path.with_suffix(".mp4")
             original_file = original_dir / self.path.name
 
-            # Create a temporary output file with different name to avoid in-place editing
-            temp_output = self.proc_config.options.temp_dir / f"temp_{self.path.name}.mp4"
+            # Create a temporary output file with different name to avoid in-place editing.
+            # It lives next to the output so the final move is a rename, not a copy.
+            temp_output = output_file.with_name(f".tmp_{output_file.name}")
 
             if not self.proc_config.options.dry_run:
                 # Build conversion command
@@ -286,33 +481,62 @@ class Clip:
                     )
                     cmd.extend(["-r", str(target_fps)])
 
-                # Add encoding options
-                video_options = self.proc_config.encoding.video_codec.get_encoding_options(
-                    quality=self.proc_config.encoding.crf, preset=self.proc_config.encoding.preset
-                )
+                # Only the container changes when the video is already in the target codec and
+                # frame rate, so remux instead of re-encoding
+                video_codec = self.proc_config.encoding.video_codec
+                same_codec = self.metadata.video_codec == video_codec.codec_name
+                if same_codec and not needs_framerate_adjustment:
+                    logger.info(f"Remuxing {self.path.name} without re-encoding video")
+                    cmd.extend(["-c:v", "copy"])
+                else:
+                    # Add encoding options
+                    video_options = video_codec.get_encoding_options(
+                        quality=self.proc_config.encoding.crf,
+                        preset=self.proc_config.encoding.preset,
+                    )
+
+                    cmd.extend(["-c:v", video_codec.value])
+                    for key, value in video_options.items():
+                        if value is not None:
+                            cmd.extend([f"-{key}", str(value)])
+                    # Keep the encoder within the configured thread budget, since movies
+                    # from several directories are processed concurrently
+                    cmd.extend(["-threads", str(self.proc_config.options.threads)])
 
-                cmd.extend(["-c:v", self.proc_config.encoding.video_codec.value])
-                for key, value in video_options.items():
-                    if value is not None:
-                        cmd.extend([f"-{key}", str(value)])
+                # Copy audio unless MP4 can't hold it
+                if self.metadata.audio_codec in MP4_AUDIO_CODECS:
+                    cmd.extend(["-c:a", "copy"])
+                elif self.metadata.audio_codec != "none":
+                    cmd.extend(["-c:a", "aac"])
 
                 # Add output file (temporary)
                 cmd.append(str(temp_output))
 
                 # Run conversion
-                self._ffmpeg._run_command(cmd)
+                try:
+                    self._ffmpeg._run_command(cmd)
+                except BaseException:
+                    # Also on Ctrl-C, so a partial file isn't left beside the clips
+                    temp_output.unlink(missing_ok=True)
+                    raise
 
                 # Move original file to original directory
-                self.path.rename(original_file)
+                _ensure_dir(original_dir)
+                os.replace(self.path, original_file)
 
                 # Move temp file to final destination
-                import shutil
-
-                shutil.move(str(temp_output), str(output_file))
+                os.replace(temp_output, output_file)
 
                 # Update clip path and metadata
-                self.path = output_file
-                self.metadata = self._extract_metadata()
+                self._set_path(output_file)
+                self.metadata = self._converted_metadata(
+                    output_file, target_fps if needs_framerate_adjustment else None
+                )
+                # Seed the cache so later runs don't probe the converted file again and keep
+                # the capture date that was read from the source file
+                cache = get_metadata_cache(self.proc_config.options.temp_dir)
+                if cache:
+                    cache.put(output_file, self._stat, metadata=self.metadata.to_dict())
 
                 logger.info(f"Converted {original_file.name} -> {output_file.name}")
             else:
@@ -347,10 +571,20 @@ class Clip:
                 if title_config is None:
                     title_config = self.dir_config.title_config
 
-                generator = TitleCardGenerator()
+                generator = _get_title_generator()
+                # The overlay only touches video, so keep MP4-compatible audio as it is
+                copy_audio = self.metadata.audio_codec in MP4_AUDIO_CODECS
+                # Render on the GPU when NVENC is enabled and this ffmpeg build has it
+                video_encoder = "libx264"
+                if self.proc_config.encoding.use_gpu and self._ffmpeg.has_encoder("h264_nvenc"):
+                    video_encoder = "h264_nvenc"
+                # Titles for several chapters render concurrently in the shared temp dir and
+                # clip names repeat across directories (e.g. camcorder 00000.MTS), so tag the
+                # file with a hash of the full source path. The overlay PNG is named after it.
+                path_hash = hashlib.sha1(str(self.path).encode("utf-8")).hexdigest()[:8]
                 output_file = (
                     self.proc_config.options.temp_dir
-                    / f"{self.metadata.name}_with_title{self.path.suffix}"
+                    / f"{self.metadata.name}_{path_hash}_with_title{self.path.suffix}"
                 )
 
                 # Generate the title sequence using the specified framerate
@@ -365,12 +599,35 @@ class Clip:
                     fps=self.metadata.frame_rate,
                     use_segment=use_segment,
                     encoding_preset=self.proc_config.encoding.preset,
+                    video_size=(self.metadata.width, self.metadata.height),
+                    ffmpeg_path=self._ffmpeg.ffmpeg_path,
+                    video_encoder=video_encoder,
+                    copy_audio=copy_audio,
+                    quality=self.proc_config.encoding.crf,
                 )
 
                 # Update clip path to point to new video with title
-                self.path = output_file
-                # Update metadata for the new clip
-                self.metadata = self._extract_metadata()
+                self._set_path(output_file)
+                # The title sequence keeps the source resolution and frame rate, so derive
+                # its metadata instead of probing the file we just wrote
+                duration = self.metadata.duration
+                if use_segment:
+                    duration = min(duration, title_config.duration)
+                self.metadata = replace(
+                    self.metadata,
+                    name=output_file.stem,
+                    extension=output_file.suffix,
+                    duration=duration,
+                    video_codec="h264",
+                    video_bitrate=0,
+                    audio_codec=(
+                        self.metadata.audio_codec
+                        if copy_audio or not self.metadata.audio_channels
+                        else "aac"
+                    ),
+                    audio_bitrate=self.metadata.audio_bitrate if copy_audio else 0,
+                    file_size=self._stat.st_size,
+                )
 
                 # Save title duration for later use
                 self.title_duration = title_config.duration + 2 * title_config.fade_duration
@@ -1,24 +1,64 @@
-"""Title card generation functionality using MoviePy."""
+"""Title card generation functionality using PIL and ffmpeg."""
 
-import json
 import logging
 import subprocess
+import unicodedata
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple
 
-from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
-from moviepy.video.fx.CrossFadeIn import CrossFadeIn
-from moviepy.video.fx.CrossFadeOut import CrossFadeOut
-from moviepy.video.fx.FadeIn import FadeIn
-from moviepy.video.fx.FadeOut import FadeOut
-from moviepy.video.io.VideoFileClip import VideoFileClip
-from moviepy.video.VideoClip import ColorClip, TextClip
+from PIL import Image, ImageDraw, ImageFont
+
+from movie_merge.constants import GPU_PRESET_MAP
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _get_font(font: str, font_size: int, basic_layout: bool = False) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per (font, size, layout), falling back to PIL's default font.
+
+    Args:
+        font: Path to the font file
+        font_size: Font size in pixels
+        basic_layout: Use Pillow's basic layout engine instead of raqm (HarfBuzz), which is
+            faster but does not shape complex scripts
+    """
+    layout_engine = ImageFont.Layout.BASIC if basic_layout else None
+    try:
+        return ImageFont.truetype(font, font_size, layout_engine=layout_engine)
+    except OSError:
+        logger.warning(f"Font not found: {font}. Using default font")
+        return ImageFont.load_default(size=font_size)
+
+
+def _needs_shaping(text: str) -> bool:
+    """Check whether text needs complex shaping (combining marks or right-to-left scripts).
+
+    Latin text such as Swedish or English renders identically with the basic layout engine.
+    """
+    return any(
+        unicodedata.category(char) in ("Mn", "Mc") or unicodedata.bidirectional(char) in ("R", "AL")
+        for char in text
+    )
+
+
+def _run_ffmpeg(cmd: List[str]) -> None:
+    """Run ffmpeg, keeping only its stderr and only reading it if the command fails.
+
+    Raises:
+        RuntimeError: If ffmpeg exits with a non-zero status
+    """
+    result = subprocess.run(
+        cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"ffmpeg failed: {stderr[-500:]}")
+
+
+@dataclass(slots=True)
 class TitleConfig:
     """Configuration for title card appearance.
 
@@ -50,7 +90,7 @@ class TitleConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DescriptionConfig:
     """Configuration for description card appearance.
 
@@ -91,7 +131,7 @@ class DescriptionConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TitleCardConfig:
     """Configuration for title card appearance.
 
@@ -127,192 +167,271 @@ class TitleCardConfig:
 
 
 class TitleCardGenerator:
-    """Generates title cards using MoviePy."""
+    """Generates title cards by rendering text with PIL and overlaying it with ffmpeg.
+
+    All text elements are rasterized once and fused into a single transparent PNG. A single
+    ffmpeg run then overlays it on the video with fading alpha and encodes the result, so
+    frames never pass through Python.
+    """
 
     def __init__(self) -> None:
         """Initialize the title card generator."""
         logger.debug("Initializing TitleCardGenerator")
-        self._video: Optional[VideoFileClip] = None
-        self._final: Optional[CompositeVideoClip] = None
+        self._video_size: Tuple[int, int] = (1920, 1080)
 
     def _build_text_args(self, text: str, config_section: Any) -> Dict[str, Any]:
-        """Build text clip arguments from configuration."""
-        video_size = self._video.size if self._video else (1920, 1080)
-
+        """Build text rendering arguments from configuration."""
         # Calculate maximum text width based on configuration
         if hasattr(config_section, "max_width_ratio"):
-            max_width = int(video_size[0] * config_section.max_width_ratio)
+            max_width = int(self._video_size[0] * config_section.max_width_ratio)
         else:
-            max_width = int(video_size[0] * 0.8)  # Default to 80% of video width
+            max_width = int(self._video_size[0] * 0.8)  # Default to 80% of video width
 
         args = {
             "text": text,
             "font_size": config_section.font_size,
             "color": config_section.font_color,
-            "font": "/usr/share/fonts/ubuntu-family/Ubuntu-M.ttf",
-            "size": (max_width, None),  # Set width constraint, let height adjust
+            "font": config_section.font,
+            "font_shadow": config_section.font_shadow,
+            "max_width": max_width,
         }
         return args
 
-    def _create_background(self, config: Any) -> ColorClip:
-        """Create semi-transparent background clip.
+    def _render_text(self, text: str, config_section: Any) -> Image.Image:
+        """Render text into a transparent image cropped to the text bounds.
 
-        Args:
-            config: Title card configuration
-
-        Returns:
-            ColorClip with fade effects
+        Text wider than the configured maximum width is rendered at a smaller font size
+        so that it fits. The glyphs are rasterized once into a coverage mask, which is used
+        as the alpha of both the text and its drop shadow.
         """
-        # First make a ColorClip with the size & color you want.
-        video_size = self._video.size if self._video else (1920, 1080)
-        bg = ColorClip(size=video_size, color=(0, 0, 0))
-        # Then set its total duration.
-        bg = bg.with_duration(config.duration)
-        # Then apply a standard fade in/out if you want color-based fading:
-        bg = FadeIn(config.fade_duration).apply(bg)
-        bg = FadeOut(config.fade_duration).apply(bg)
-
-        # Finally, set its opacity. (You can do this earlier, but this is a clear place.)
-        # “with_opacity()” is the new method for setting alpha in MoviePy 2.x
-        bg = bg.with_opacity(config.background_opacity)
-
-        return bg
-
-    def _create_text_clip(
-        self, text: str, config_section: Any, config: Any, y_position: Optional[int] = None
-    ) -> TextClip:
-        """Create and return a text clip with fade effects."""
         text_args = self._build_text_args(text, config_section)
-        clip = TextClip(**text_args)
+        font_size = text_args["font_size"]
+        basic_layout = not _needs_shaping(text)
+        font = _get_font(text_args["font"], font_size, basic_layout)
+
+        draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        left, top, right, bottom = draw.multiline_textbbox((0, 0), text, font=font)
+        if right - left > text_args["max_width"]:
+            font_size = max(1, font_size * text_args["max_width"] // (right - left))
+            font = _get_font(text_args["font"], font_size, basic_layout)
+            left, top, right, bottom = draw.multiline_textbbox((0, 0), text, font=font)
+
+        size = (max(1, right - left), max(1, bottom - top))
+        mask = Image.new("L", size, 0)
+        ImageDraw.Draw(mask).multiline_text(
+            (-left, -top), text, font=font, fill=255, align="center"
+        )
+        text_image = Image.new("RGBA", size, text_args["color"])
+        text_image.putalpha(mask)
+        if not text_args["font_shadow"]:
+            return text_image
+
+        shadow_offset = max(1, font_size // 25)
+        shadow = Image.new("RGBA", size, (0, 0, 0, 255))
+        shadow.putalpha(mask)
+        image = Image.new("RGBA", (size[0] + shadow_offset, size[1] + shadow_offset))
+        image.alpha_composite(shadow, (shadow_offset, shadow_offset))
+        image.alpha_composite(text_image)
+        return image
+
+    def _text_position(
+        self, text: str, image: Image.Image, config_section: Any, y_position: Optional[int]
+    ) -> Tuple[int, int]:
+        """Get the top-left corner of a rendered text image on the video frame."""
+        video_width, video_height = self._video_size
+        x = (video_width - image.width) // 2
 
-        video_size = self._video.size if self._video else (1920, 1080)
-        video_width, video_height = video_size
-
-        # Calculate position with bounds checking
-        position: Union[str, Tuple[str, int]]
         if y_position is None:
             # This is the title - center it
-            position = "center"
-            logger.debug(f"Title '{text[:30]}...' positioned at: center")
+            logger.debug("Title '%s...' positioned at: center", text[:30])
+            return x, (video_height - image.height) // 2
+
+        # This is description or location - use relative positioning below the center
+        center_y = video_height // 2
+        if hasattr(config_section, "relative_offset"):
+            adjusted_y = center_y + int(video_height * config_section.relative_offset)
+            logger.debug("Using relative offset: %s", config_section.relative_offset)
         else:
-            # This is description or location - use relative positioning
-            center_y = video_height // 2
-
-            # Use relative offset if available, fallback to absolute offset
-            if hasattr(config_section, "relative_offset"):
-                relative_offset_pixels = int(video_height * config_section.relative_offset)
-                adjusted_y = center_y + relative_offset_pixels
-                logger.debug(
-                    f"Using relative offset: {config_section.relative_offset} ({relative_offset_pixels}px)"
+            # Fallback to legacy absolute offset
+            adjusted_y = center_y + config_section.offset
+            logger.debug("Using absolute offset: %spx", config_section.offset)
+
+        # Keep the text 20px above the bottom of the video and 10px below the center (to
+        # avoid overlapping the title)
+        y = max(min(adjusted_y, video_height - image.height - 20), center_y + 10)
+        logger.debug("Text '%s...' positioned at: %s", text[:30], y)
+        return x, y
+
+    def _place_text(
+        self, text: str, config_section: Any, y_position: Optional[int] = None
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """Render text and compute where it goes on the video frame."""
+        image = self._render_text(text, config_section)
+        return image, self._text_position(text, image, config_section, y_position)
+
+    def _build_overlays(
+        self,
+        title: str,
+        description: Optional[str],
+        location: Optional[str],
+        config: TitleCardConfig,
+    ) -> List[Tuple[Image.Image, Tuple[int, int]]]:
+        """Render every text element of the title card.
+
+        Returns:
+            List of (rendered text image, top-left position on the video frame)
+        """
+        overlays = []
+
+        # Create title overlay
+        logger.debug("Adding title: %s", title)
+        overlays.append(self._place_text(title, config.title))
+
+        # Add description and/or location text
+        if description:
+            logger.debug("Adding description: %s", description)
+
+            # If both description and location exist, add location first (above description)
+            if location:
+                logger.debug("Adding location above description: %s", location)
+                # Create a custom config for location with smaller offset
+                location_config = DescriptionConfig(
+                    font=config.description.font,
+                    font_size=int(
+                        config.description.font_size * 0.8
+                    ),  # Slightly smaller than description
+                    font_color=config.description.font_color,
+                    offset=int(
+                        config.description.offset * 0.6
+                    ),  # Legacy: position between title and description
+                    relative_offset=config.description.relative_offset
+                    * 0.5,  # Half the description offset
+                    font_shadow=config.description.font_shadow,
+                    kerning=config.description.kerning,
+                    interline=config.description.interline,
+                    max_width_ratio=config.description.max_width_ratio,
                 )
-            else:
-                # Fallback to legacy absolute offset
-                adjusted_y = center_y + config_section.offset
-                logger.debug(f"Using absolute offset: {config_section.offset}px")
-
-            # Get text clip dimensions for bounds checking
-            # We need to create a temporary clip to get its size
-            temp_clip = TextClip(**text_args)
-            text_height = (
-                temp_clip.size[1]
-                if (temp_clip.size and len(temp_clip.size) > 1)
-                else config_section.font_size
-            )
-            temp_clip.close()
-
-            # Ensure text doesn't go below the bottom of the video
-            max_y = video_height - text_height - 20  # 20px margin from bottom
-            if adjusted_y > max_y:
-                adjusted_y = max_y
-                logger.warning(
-                    f"Text '{text[:30]}...' position clamped to {adjusted_y} (was going to be off-screen)"
+                overlays.append(self._place_text(location, location_config, y_position=1))
+
+                # Create description config with larger offset to make room for location
+                desc_config = DescriptionConfig(
+                    font=config.description.font,
+                    font_size=config.description.font_size,
+                    font_color=config.description.font_color,
+                    offset=config.description.offset
+                    + int(config.description.offset * 0.8),  # Legacy: push down further
+                    relative_offset=config.description.relative_offset
+                    * 1.5,  # Push down further with relative positioning
+                    font_shadow=config.description.font_shadow,
+                    kerning=config.description.kerning,
+                    interline=config.description.interline,
+                    max_width_ratio=config.description.max_width_ratio,
                 )
+            else:
+                # No location, use normal description config
+                desc_config = config.description
 
-            # Ensure text doesn't go above the center (to avoid overlapping title)
-            min_y = center_y + 10  # 10px margin from center
-            if adjusted_y < min_y:
-                adjusted_y = min_y
-                logger.warning(
-                    f"Text '{text[:30]}...' position clamped to {adjusted_y} (was overlapping title)"
-                )
+            # Add the description overlay
+            overlays.append(self._place_text(description, desc_config, y_position=1))
 
-            position = ("center", adjusted_y)
+        elif location:
+            # No description, but location exists - show formatted location as the main text
+            formatted_location = f"Plats: {location}"
             logger.debug(
-                f"Text '{text[:30]}...' - Video size: {video_size}, Center Y: {center_y}, Final position: {position}, Text height: {text_height}"
+                "Adding formatted location as main text (no description): %s", formatted_location
             )
+            overlays.append(self._place_text(formatted_location, config.description, y_position=1))
 
-        # 1) Set duration
-        clip = clip.with_duration(config.duration)
-        # 2) Set position
-        clip = clip.with_position(position)
-        # 3) Apply crossfade in/out
-        clip = CrossFadeIn(config.fade_duration).apply(clip)
-        clip = CrossFadeOut(config.fade_duration).apply(clip)
+        return overlays
 
-        return clip
+    def _fuse_overlays(
+        self,
+        overlays: List[Tuple[Image.Image, Tuple[int, int]]],
+        background_opacity: float = 0.0,
+    ) -> Optional[Tuple[Image.Image, str]]:
+        """Fuse the rendered text elements into one image cropped to the text.
 
-    def _cleanup(self, clips: list) -> None:
-        """Clean up video clips.
+        One overlay input costs a single fade and blend per frame instead of one per text
+        element, and cropping keeps the blended area to the text itself. A background is
+        painted into the same image, so it fades in and out together with the text.
 
         Args:
-            clips: List of clips to close
-        """
-        logger.debug("Cleaning up resources")
-        for clip in clips:
-            if clip:
-                try:
-                    clip.close()
-                except Exception as e:
-                    logger.warning(f"Error closing clip: {e}")
+            overlays: Rendered text images and their top-left positions on the video frame
+            background_opacity: Opacity of the black background behind the text (0 for none)
 
-    def extract_title_segment(
-        self,
-        input_file: Path,
-        output_file: Path,
-        duration: float,
-        threads: int = 4,
-        encoding_preset: str = "medium",
-    ) -> None:
-        """Extract a segment from the beginning of a video for title overlay.
+        Returns:
+            The fused image and its ffmpeg overlay x/y options, or None if there is no text.
+            The position is relative to the frame center, so text stays centered if the
+            decoded frame size differs from the probed one (e.g. rotated videos).
+        """
+        video_width, video_height = self._video_size
+        background_alpha = round(255 * min(max(background_opacity, 0.0), 1.0))
+        canvas = Image.new("RGBA", self._video_size, (0, 0, 0, background_alpha))
+        for image, (x, y) in overlays:
+            canvas.alpha_composite(image, (max(0, x), max(0, y)))
+
+        bbox = canvas.getbbox()
+        if bbox is None:
+            return None
+        left, top = bbox[0], bbox[1]
+        position = f"x='(W-{video_width})/2+{left}':y='(H-{video_height})/2+{top}'"
+        return canvas.crop(bbox), position
+
+    def _build_filter_graph(self, position: Optional[str], config: TitleCardConfig) -> str:
+        """Build the ffmpeg filter graph compositing the text overlay onto input 0.
+
+        The overlay (text and background) is read from input 1 and placed with position. It
+        fades in and out on its alpha channel over config.duration.
+        """
+        if position is None:
+            return "[0:v]null[vout]"
+
+        duration = config.duration
+        fade = config.fade_duration
+        return (
+            f"[1:v]format=rgba,"
+            f"fade=t=in:st=0:d={fade}:alpha=1,"
+            f"fade=t=out:st={max(0.0, duration - fade)}:d={fade}:alpha=1[text];"
+            f"[0:v][text]overlay={position}:eof_action=pass[vout]"
+        )
+
+    def _encoder_args(
+        self, video_encoder: str, encoding_preset: str, threads: int, quality: int
+    ) -> List[str]:
+        """Build the ffmpeg video encoder options for the title encode.
 
         Args:
-            input_file: Path to input video file
-            output_file: Path to output video file
-            duration: Duration in seconds to extract
-            threads: Number of threads to use for processing
+            video_encoder: "libx264" or "h264_nvenc"
+            encoding_preset: x264 preset, mapped to the matching NVENC preset for h264_nvenc
+            threads: Number of threads libx264 may use (NVENC encodes on the GPU)
+            quality: Constant quality level, used as -crf for libx264 and -cq for NVENC
         """
-        try:
-            logger.info(f"Extracting {duration}s segment from: {input_file}")
-
-            # Use ffmpeg to extract the segment
-            cmd = [
-                self._ffmpeg.ffmpeg_path if hasattr(self, "_ffmpeg") else "ffmpeg",
-                "-y",
-                "-i",
-                str(input_file),
-                "-ss",
-                "0",
-                "-t",
-                str(duration),
+        if video_encoder.endswith("_nvenc"):
+            # Constant quality VBR; NVENC otherwise targets a low fixed bitrate
+            return [
                 "-c:v",
-                "libx264",
-                "-c:a",
-                "aac",
+                video_encoder,
                 "-preset",
-                encoding_preset,
-                "-threads",
-                str(threads),
-                str(output_file),
+                GPU_PRESET_MAP.get(encoding_preset, "p4"),
+                "-tune",
+                "hq",
+                "-rc",
+                "vbr",
+                "-cq",
+                str(quality),
+                "-b:v",
+                "0",
             ]
-
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.info(f"Successfully extracted title segment to {output_file}")
-
-        except Exception as e:
-            logger.error(f"Failed to extract title segment: {str(e)}")
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.exception("Traceback:")
-            raise RuntimeError(f"Failed to extract title segment: {str(e)}") from e
+        return [
+            "-c:v",
+            video_encoder,
+            "-preset",
+            encoding_preset,
+            "-crf",
+            str(quality),
+            "-threads",
+            str(threads),
+        ]
 
     def generate_title_sequence(
         self,
@@ -326,144 +445,103 @@ class TitleCardGenerator:
         fps: float = 30.0,
         use_segment: bool = True,
         encoding_preset: str = "medium",
+        video_size: Optional[Tuple[int, int]] = None,
+        ffmpeg_path: str = "ffmpeg",
+        video_encoder: str = "libx264",
+        copy_audio: bool = False,
+        quality: int = 23,
     ) -> None:
-        """Generate a title sequence for a video."""
-        clips_to_close = []
-        temp_segment_file = None
+        """Generate a title sequence for a video.
+
+        Args:
+            input_file: Path to input video file
+            output_file: Path to output video file
+            title: Title text
+            description: Optional description text
+            location: Optional location text
+            config: Title card configuration
+            threads: Number of threads ffmpeg may use
+            fps: Output frame rate
+            use_segment: Only render the first config.duration seconds of the video
+            encoding_preset: x264 preset, mapped to the matching NVENC preset for h264_nvenc
+            video_size: Video (width, height), used to limit the text width
+            ffmpeg_path: Path to the ffmpeg executable
+            video_encoder: H.264 encoder to use ("libx264" or "h264_nvenc")
+            copy_audio: Copy the audio stream instead of encoding it to AAC. Only use this
+                when the input audio can be stored in the output container.
+            quality: Constant quality level (CRF for libx264, CQ for NVENC)
+        """
+        overlay_file: Optional[Path] = None
 
         try:
             if config is None:
                 config = TitleCardConfig()
+            if video_size:
+                self._video_size = video_size
 
             logger.info(f"Generating title sequence for: {title}")
 
-            # Use a short segment if requested
-            working_input = input_file
+            # Read only the first config.duration seconds of the input if requested, so the
+            # segment is decoded straight from the source instead of being encoded first
+            cmd = [ffmpeg_path, "-hide_banner", "-v", "error", "-y"]
+            if video_encoder.endswith("_nvenc"):
+                # Decode on NVDEC too; frames are downloaded for the CPU overlay filters and
+                # ffmpeg falls back to software decoding for unsupported codecs
+                cmd.extend(["-hwaccel", "cuda"])
             if use_segment:
-                # Create temporary file for the segment
-                temp_segment_file = output_file.with_name(f"temp_segment_{output_file.name}")
-                self.extract_title_segment(
-                    input_file=input_file,
-                    output_file=temp_segment_file,
-                    duration=config.duration,
-                    threads=threads,
-                    encoding_preset=encoding_preset,
-                )
-                working_input = temp_segment_file
-
-            # Load the video (either full or segment)
-            self._video = VideoFileClip(str(working_input))
-            clips_to_close.append(self._video)
-
-            # Create clips list starting with video
-            clips = [self._video]
-
-            # Add semi-transparent background if enabled
-            if config.background_opacity > 0:
-                bg = self._create_background(config)
-                clips_to_close.append(bg)
-                clips.append(bg)
-
-            # Create title clip with fade effects
-            logger.debug(f"Adding title: {title}")
-            title_clip = self._create_text_clip(title, config.title, config)
-            clips_to_close.append(title_clip)
-            clips.append(title_clip)
-
-            # Add description and/or location text
-            if description:
-                logger.debug(f"Adding description: {description}")
-
-                # If both description and location exist, add location first (above description)
-                if location:
-                    logger.debug(f"Adding location above description: {location}")
-                    # Create a custom config for location with smaller offset
-                    location_config = DescriptionConfig(
-                        font=config.description.font,
-                        font_size=int(
-                            config.description.font_size * 0.8
-                        ),  # Slightly smaller than description
-                        font_color=config.description.font_color,
-                        offset=int(
-                            config.description.offset * 0.6
-                        ),  # Legacy: position between title and description
-                        relative_offset=config.description.relative_offset
-                        * 0.5,  # Half the description offset
-                        font_shadow=config.description.font_shadow,
-                        kerning=config.description.kerning,
-                        interline=config.description.interline,
-                        max_width_ratio=config.description.max_width_ratio,
-                    )
-                    location_clip = self._create_text_clip(
-                        location,
-                        location_config,
-                        config,
-                        y_position=1,  # Any non-None value will trigger positioning logic
-                    )
-                    clips_to_close.append(location_clip)
-                    clips.append(location_clip)
-
-                    # Create description config with larger offset to make room for location
-                    desc_config = DescriptionConfig(
-                        font=config.description.font,
-                        font_size=config.description.font_size,
-                        font_color=config.description.font_color,
-                        offset=config.description.offset
-                        + int(config.description.offset * 0.8),  # Legacy: push down further
-                        relative_offset=config.description.relative_offset
-                        * 1.5,  # Push down further with relative positioning
-                        font_shadow=config.description.font_shadow,
-                        kerning=config.description.kerning,
-                        interline=config.description.interline,
-                        max_width_ratio=config.description.max_width_ratio,
-                    )
-                else:
-                    # No location, use normal description config
-                    desc_config = config.description
-
-                # Add the description clip
-                desc_clip = self._create_text_clip(
-                    description,
-                    desc_config,
-                    config,
-                    y_position=1,  # Any non-None value will trigger positioning logic
-                )
-                clips_to_close.append(desc_clip)
-                clips.append(desc_clip)
-
-            elif location:
-                # No description, but location exists - show formatted location as the main text
-                formatted_location = f"Plats: {location}"
-                logger.debug(
-                    f"Adding formatted location as main text (no description): {formatted_location}"
-                )
-                location_clip = self._create_text_clip(
-                    formatted_location,
-                    config.description,  # Use normal description config for positioning
-                    config,
-                    y_position=1,  # Any non-None value will trigger positioning logic
-                )
-                clips_to_close.append(location_clip)
-                clips.append(location_clip)
+                cmd.extend(["-t", str(config.duration)])
+            cmd.extend(["-i", str(input_file)])
 
-            # Combine all clips
-            logger.debug("Compositing video clips")
-            self._final = CompositeVideoClip(clips)
-            clips_to_close.append(self._final)
+            # Render the text once and write it as a single PNG overlay input
+            fused = self._fuse_overlays(
+                self._build_overlays(title, description, location, config),
+                config.background_opacity,
+            )
+            position = None
+            if fused is not None:
+                image, position = fused
+                overlay_file = output_file.with_name(f"overlay_{output_file.stem}.png")
+                image.save(overlay_file)
+                cmd.extend(
+                    [
+                        "-loop",
+                        "1",
+                        "-framerate",
+                        str(fps),
+                        "-t",
+                        str(config.duration),
+                        "-i",
+                        str(overlay_file),
+                    ]
+                )
 
-            logger.debug(f"Threads: {threads}, FPS: {fps}")
+            filter_graph = self._build_filter_graph(position, config)
+            logger.debug("Threads: %s, FPS: %s", threads, fps)
+
+            cmd.extend(
+                [
+                    "-filter_complex",
+                    filter_graph,
+                    "-map",
+                    "[vout]",
+                    "-map",
+                    "0:a?",
+                    "-r",
+                    str(fps),
+                    *self._encoder_args(video_encoder, encoding_preset, threads, quality),
+                    "-pix_fmt",
+                    "yuv420p",
+                    "-c:a",
+                    "copy" if copy_audio else "aac",
+                    str(output_file),
+                ]
+            )
 
             # Write to file
             logger.info(f"Writing title sequence to: {output_file}")
-            self._final.write_videofile(
-                str(output_file),
-                fps=fps,
-                codec="libx264",
-                audio_codec="aac",
-                preset=encoding_preset,
-                threads=threads,
-                logger=None,  # Disable moviepy's internal logging
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
+            _run_ffmpeg(cmd)
 
             logger.info("Successfully generated title sequence")
 
@@ -474,13 +552,10 @@ class TitleCardGenerator:
             raise RuntimeError(f"Failed to generate title sequence: {str(e)}") from e
 
         finally:
-            # Clean up resources
-            self._cleanup(clips_to_close)
-
-            # Remove temporary segment if created
-            if temp_segment_file and Path(temp_segment_file).exists():
+            # Remove the temporary overlay image
+            if overlay_file is not None and overlay_file.exists():
                 try:
-                    Path(temp_segment_file).unlink()
-                    logger.debug(f"Removed temporary segment file: {temp_segment_file}")
+                    overlay_file.unlink()
+                    logger.debug("Removed temporary file: %s", overlay_file)
                 except Exception as e:
-                    logger.warning(f"Failed to remove temporary segment file: {e}")
+                    logger.warning(f"Failed to remove temporary file: {e}")
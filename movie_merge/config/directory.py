@@ -4,13 +4,12 @@ import json
 import logging
 import re
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-import yaml
-
 from movie_merge.constants import METADATA_FILE
 
 from ..clip.title import DescriptionConfig, TitleCardConfig, TitleConfig
@@ -19,8 +18,52 @@ from .sort import SortConfig, SortMethod
 
 logger = logging.getLogger(__name__)
 
+# Folder names start with a YYYY-MM-DD date
+_FOLDER_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+# Punctuation stripped from a word before checking it against _LOWERCASE_WORDS
+_PUNCTUATION_RE = re.compile(r"[^\w\såäöÅÄÖ]")
+
+# Words that should remain lowercase in titles (Swedish articles, prepositions, etc.)
+_LOWERCASE_WORDS = frozenset(
+    {
+        "och",
+        "eller",
+        "men",
+        "utan",
+        "av",
+        "på",
+        "i",
+        "för",
+        "till",
+        "från",
+        "med",
+        "över",
+        "under",
+        "vid",
+        "genom",
+        "mot",
+        "om",
+        "åt",
+        "ur",
+        "and",
+        "or",
+        "but",
+        "the",
+        "a",
+        "an",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+    }
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     """Movie metadata."""
 
@@ -43,7 +86,7 @@ class Metadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryConfig:
     """Configuration for directory processing."""
 
@@ -75,58 +118,21 @@ def format_title_case(text: str) -> str:
     if not text:
         return text
 
-    # Words that should remain lowercase in titles (Swedish articles, prepositions, etc.)
-    lowercase_words = {
-        "och",
-        "eller",
-        "men",
-        "utan",
-        "av",
-        "på",
-        "i",
-        "för",
-        "till",
-        "från",
-        "med",
-        "över",
-        "under",
-        "vid",
-        "genom",
-        "mot",
-        "om",
-        "åt",
-        "ur",
-        "and",
-        "or",
-        "but",
-        "the",
-        "a",
-        "an",
-        "in",
-        "on",
-        "at",
-        "to",
-        "for",
-        "of",
-        "with",
-        "by",
-    }
-
     words = text.split()
     formatted_words = []
 
     for i, word in enumerate(words):
         # Clean word (remove punctuation for checking)
-        clean_word = re.sub(r"[^\w\såäöÅÄÖ]", "", word.lower())
+        clean_word = _PUNCTUATION_RE.sub("", word.lower())
 
         # First word is always capitalized
         if i == 0:
             formatted_words.append(word.capitalize())
         # Check if it's a number with suffix (like "65år")
-        elif re.match(r"\d+\w*", clean_word):
+        elif clean_word[:1].isdecimal():
             formatted_words.append(word.lower())
         # Keep lowercase words lowercase (except first word)
-        elif clean_word in lowercase_words:
+        elif clean_word in _LOWERCASE_WORDS:
             formatted_words.append(word.lower())
         # Capitalize other words
         else:
@@ -137,8 +143,7 @@ def format_title_case(text: str) -> str:
 
 def parse_folder_name(folder_name: str) -> Tuple[datetime, str, Optional[str]]:
     """Parse folder name with format 'YYYY-MM-DD - Title [- Location]'."""
-    date_pattern = r"^(\d{4}-\d{2}-\d{2})"
-    match = re.match(date_pattern, folder_name)
+    match = _FOLDER_DATE_RE.match(folder_name)
 
     if not match:
         raise DirectoryParseError(
@@ -146,7 +151,7 @@ def parse_folder_name(folder_name: str) -> Tuple[datetime, str, Optional[str]]:
         )
 
     try:
-        date = datetime.strptime(match.group(1), "%Y-%m-%d")
+        date = datetime.fromisoformat(match.group(1))
     except ValueError as e:
         raise DirectoryParseError(f"Invalid date format in folder name: {folder_name}") from e
 
@@ -176,11 +181,26 @@ def parse_directory_config(directory: Path) -> DirectoryConfig:
         config.metadata = Metadata()  # Create empty metadata if folder parsing fails
 
     # Try to parse from metadata.yaml to override/supplement folder metadata
-    if metadata_path.exists():
+    # Opening directly saves a separate stat per directory, which adds up on network shares
+    try:
+        raw_yaml = metadata_path.read_bytes()
+    except FileNotFoundError:
+        raw_yaml = None
+    except OSError as e:
+        logger.warning(f"Failed to read metadata.yaml: {e}")
+        raw_yaml = None
+
+    if raw_yaml is not None:
         logger.debug(f"Found metadata file: {metadata_path}")
         try:
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f)
+            # Imported here so runs without any reel.yaml never load PyYAML
+            import yaml
+
+            # libyaml's C loader parses many times faster than the pure-Python SafeLoader and
+            # builds the same objects; fall back to SafeLoader when PyYAML lacks libyaml.
+            # Hand it the raw bytes; it decodes UTF-8 itself.
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            yaml_data = yaml.load(raw_yaml, Loader=loader)
 
             if isinstance(yaml_data, dict):
                 # Parse metadata section
@@ -221,9 +241,10 @@ def parse_directory_config(directory: Path) -> DirectoryConfig:
 
     config.root_dir = directory
 
-    logger.debug(
-        f"Parsed directory config: {json.dumps(config.to_dict(), indent=2, ensure_ascii=False)}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Parsed directory config: {json.dumps(config.to_dict(), indent=2, ensure_ascii=False)}"
+        )
     return config
 
 
@@ -235,19 +256,33 @@ def _parse_date(date_value: Optional[str]) -> Optional[datetime]:
     if isinstance(date_value, datetime):
         return date_value
 
-    try:
-        return datetime.strptime(date_value, "%Y-%m-%d")
-    except ValueError:
-        logger.warning(f"Invalid date format: {date_value}")
-        return None
+    # YAML loads unquoted YYYY-MM-DD values as dates
+    if isinstance(date_value, date):
+        return datetime(date_value.year, date_value.month, date_value.day)
+
+    # fromisoformat also takes forms like 20240101 or 2024-W01-1, so only hand it YYYY-MM-DD
+    if isinstance(date_value, str) and _FOLDER_DATE_RE.fullmatch(date_value):
+        try:
+            return datetime.fromisoformat(date_value)
+        except ValueError:
+            pass
+    logger.warning(f"Invalid date format: {date_value}")
+    return None
+
+
+@lru_cache(maxsize=16)
+def _sort_method_from_str(method_name: str) -> SortMethod:
+    """Look up a SortMethod by case-insensitive name, raising ValueError if unknown."""
+    return SortMethod(method_name.lower())
 
 
 def _parse_sort_config(config: dict) -> SortConfig:
     """Parse sort configuration from dictionary."""
+    method_name = config.get("method") or "datetime"
     try:
-        method = SortMethod(config.get("method", "datetime").lower())
+        method = _sort_method_from_str(method_name)
     except ValueError:
-        logger.warning(f"Invalid sort method: {config.get('method')}")
+        logger.warning(f"Invalid sort method: {method_name}")
         method = SortMethod.DATETIME
 
     return SortConfig(
@@ -259,25 +294,25 @@ def _parse_sort_config(config: dict) -> SortConfig:
 
 def _parse_title_config(config: dict) -> TitleCardConfig:
     """Parse title configuration from dictionary."""
+    title_cfg = config.get("title") or {}
+    desc_cfg = config.get("description") or {}
     return TitleCardConfig(
         title=TitleConfig(
-            font=config.get("title", {}).get("font", "/usr/share/fonts/ubuntu-family/Ubuntu-M.ttf"),
-            font_size=config.get("title", {}).get("font_size", 70),
-            font_color=config.get("title", {}).get("font_color", "white"),
-            font_shadow=config.get("title", {}).get("font_shadow", True),
-            kerning=config.get("description", {}).get("kerning", 1),
-            interline=config.get("description", {}).get("interline", 1.5),
+            font=title_cfg.get("font", "/usr/share/fonts/ubuntu-family/Ubuntu-M.ttf"),
+            font_size=title_cfg.get("font_size", 70),
+            font_color=title_cfg.get("font_color", "white"),
+            font_shadow=title_cfg.get("font_shadow", True),
+            kerning=desc_cfg.get("kerning", 1),
+            interline=desc_cfg.get("interline", 1.5),
         ),
         description=DescriptionConfig(
-            font=config.get("description", {}).get(
-                "font", "/usr/share/fonts/ubuntu-family/Ubuntu-M.ttf"
-            ),
-            font_size=config.get("description", {}).get("font_size", 50),
-            font_color=config.get("description", {}).get("font_color", "white"),
-            offset=config.get("description", {}).get("offset", 50),
-            font_shadow=config.get("description", {}).get("font_shadow", True),
-            kerning=config.get("description", {}).get("kerning", 1),
-            interline=config.get("description", {}).get("interline", 1.5),
+            font=desc_cfg.get("font", "/usr/share/fonts/ubuntu-family/Ubuntu-M.ttf"),
+            font_size=desc_cfg.get("font_size", 50),
+            font_color=desc_cfg.get("font_color", "white"),
+            offset=desc_cfg.get("offset", 50),
+            font_shadow=desc_cfg.get("font_shadow", True),
+            kerning=desc_cfg.get("kerning", 1),
+            interline=desc_cfg.get("interline", 1.5),
         ),
         fade_duration=config.get("fade_duration", 2.0),
         duration=config.get("duration", 7.0),
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional, Tuple, Union
 from ..enums import AudioCodec, VideoCodec, VideoTune
 
 
-@dataclass
+@dataclass(slots=True)
 class EncodingConfig:
     """Configuration for video encoding."""
 
@@ -64,7 +64,7 @@ class EncodingConfig:
         return {**video_options, **audio_options}
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingOptions:
     """General processing options."""
 
@@ -102,7 +102,7 @@ class ProcessingOptions:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Main processing configuration."""
 
@@ -128,8 +128,9 @@ class ProcessingConfig:
         if not self.input_path.exists():
             raise ValueError(f"Input directory does not exist: {self.input_path}")
 
-        # Create output directory if it doesn't exist
-        self.output_path.mkdir(parents=True, exist_ok=True)
+        # Create output directory if it doesn't exist (dry runs leave the filesystem alone)
+        if not self.options.dry_run:
+            self.output_path.mkdir(parents=True, exist_ok=True)
 
         # Validate years
         if not self.years:
@@ -140,7 +141,8 @@ class ProcessingConfig:
             self.options.temp_dir = self.output_path / "temp"
 
         # Create temp directory
-        self.options.temp_dir.mkdir(parents=True, exist_ok=True)
+        if not self.options.dry_run:
+            self.options.temp_dir.mkdir(parents=True, exist_ok=True)
 
     def to_dict(self) -> dict:
         """Convert configuration to dictionary."""
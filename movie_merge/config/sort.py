@@ -14,7 +14,7 @@ class SortMethod(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class SortConfig:
     """Configuration for sorting videos."""
 
@@ -1,39 +1,48 @@
 """Constants used in the movie_merge package."""
 
-UNSUPPORTED_VIDEO_EXTENSIONS = [".wmv", ".mts"]  # Windows Media Video  # AVCHD Video
+from types import MappingProxyType
 
-GPU_PRESET_MAP = {
-    "fastest": "p1",
-    "faster": "p2",
-    "fast": "p3",
-    "medium": "p4",
-    "slow": "p5",
-    "slower": "p6",
-    "slowet": "p7",
-}
+UNSUPPORTED_VIDEO_EXTENSIONS = frozenset({".wmv", ".mts"})  # Windows Media Video  # AVCHD Video
 
-VIDEO_EXTENSIONS = {
-    ".mp4",  # MPEG-4 Part 14
-    ".mkv",  # Matroska Video
-    ".avi",  # Audio Video Interleave
-    ".mov",  # QuickTime Movie
-    ".wmv",  # Windows Media Video
-    ".flv",  # Flash Video
-    ".mts",  # AVCHD Video
-    ".m2ts",  # Blu-ray BDAV Video
-    ".ts",  # MPEG Transport Stream
-    ".webm",  # WebM Video
-    ".m4v",  # iTunes Video
-    ".3gp",  # 3GPP Multimedia
-    ".mpg",  # MPEG-1 Systems/Video
-    ".mpeg",  # MPEG-1 Systems/Video
-    ".vob",  # DVD Video Object
-    ".asf",  # Advanced Systems Format
-    ".rm",  # RealMedia
-    ".rmvb",  # RealMedia Variable Bitrate
-    ".m2v",  # MPEG-2 Video
-    ".ogv",  # Ogg Video
-}
+# Audio codecs (ffprobe codec names) that can be stream-copied into an MP4 container
+MP4_AUDIO_CODECS = frozenset({"aac", "mp3", "ac3", "eac3", "alac"})
+
+GPU_PRESET_MAP = MappingProxyType(
+    {
+        "fastest": "p1",
+        "faster": "p2",
+        "fast": "p3",
+        "medium": "p4",
+        "slow": "p5",
+        "slower": "p6",
+        "slowet": "p7",
+    }
+)
+
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mp4",  # MPEG-4 Part 14
+        ".mkv",  # Matroska Video
+        ".avi",  # Audio Video Interleave
+        ".mov",  # QuickTime Movie
+        ".wmv",  # Windows Media Video
+        ".flv",  # Flash Video
+        ".mts",  # AVCHD Video
+        ".m2ts",  # Blu-ray BDAV Video
+        ".ts",  # MPEG Transport Stream
+        ".webm",  # WebM Video
+        ".m4v",  # iTunes Video
+        ".3gp",  # 3GPP Multimedia
+        ".mpg",  # MPEG-1 Systems/Video
+        ".mpeg",  # MPEG-1 Systems/Video
+        ".vob",  # DVD Video Object
+        ".asf",  # Advanced Systems Format
+        ".rm",  # RealMedia
+        ".rmvb",  # RealMedia Variable Bitrate
+        ".m2v",  # MPEG-2 Video
+        ".ogv",  # Ogg Video
+    }
+)
 
 IGNORE_FILE = ".reelignore"
 
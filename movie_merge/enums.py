@@ -38,6 +38,11 @@ class VideoCodec(Enum):
         """Check if this codec supports GPU acceleration."""
         return self in self.get_gpu_codecs()
 
+    @property
+    def codec_name(self) -> str:
+        """Codec name of the encoded stream as reported by ffprobe (e.g. "h264")."""
+        return self.value.removesuffix("_nvenc")
+
     def get_encoding_options(
         self, quality: int = 20, preset: str = "medium", tune: VideoTune = None
     ) -> Dict[str, str]:
@@ -4,12 +4,57 @@ import json
 import logging
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from ..config.processing import EncodingConfig, ProcessingOptions
 from .exceptions import FFmpegError, FFprobeError
 
+_default_ffmpeg: Optional["FFmpegWrapper"] = None
+_default_ffmpeg_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    """Look up an executable in PATH, resolving each name once per process."""
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=None)
+def list_encoders(ffmpeg_path: str) -> frozenset:
+    """List the encoders an ffmpeg build provides, running ``ffmpeg -encoders`` once per binary.
+
+    Returns:
+        Set of encoder names, empty if ffmpeg could not be run
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # Encoder lines look like " V....D libx264   libx264 H.264 ..." after a " ------" separator
+    _, _, listing = result.stdout.partition("------")
+    return frozenset(
+        parts[1] for parts in (line.split() for line in listing.splitlines()) if len(parts) > 1
+    )
+
+
+def get_default_ffmpeg() -> "FFmpegWrapper":
+    """Get the shared FFmpegWrapper, creating it on first use."""
+    global _default_ffmpeg
+    with _default_ffmpeg_lock:
+        if _default_ffmpeg is None:
+            _default_ffmpeg = FFmpegWrapper()
+        return _default_ffmpeg
+
 
 class FFmpegWrapper:
     """Wrapper for FFmpeg operations."""
@@ -30,8 +75,8 @@ class FFmpegWrapper:
         Raises:
             FFmpegError: If ffmpeg or ffprobe executables are not found
         """
-        self.ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg")
-        self.ffprobe_path = ffprobe_path or shutil.which("ffprobe")
+        self.ffmpeg_path = ffmpeg_path or find_executable("ffmpeg")
+        self.ffprobe_path = ffprobe_path or find_executable("ffprobe")
 
         if not self.ffmpeg_path:
             raise FFmpegError("ffmpeg executable not found in PATH")
@@ -45,7 +90,8 @@ class FFmpegWrapper:
     ) -> subprocess.CompletedProcess:
         """Run a command and handle errors."""
         try:
-            self.logger.debug(f"Running command: {' '.join(cmd)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Running command: {' '.join(cmd)}")
             result = subprocess.run(cmd, capture_output=capture_output, text=True, check=check)
             return result
         except subprocess.CalledProcessError as e:
@@ -56,18 +102,34 @@ class FFmpegWrapper:
             self.logger.error(f"Error running command: {str(e)}")
             raise FFmpegError(f"Error running command: {str(e)}")
 
-    def probe(self, input_file: Union[str, Path]) -> Dict[str, Any]:
-        """Get media file information using ffprobe."""
-        cmd = [
-            self.ffprobe_path,
-            "-v",
-            "error",
-            "-print_format",
-            "json",
-            "-show_format",
-            "-show_streams",
-            str(input_file),
-        ]
+    def has_encoder(self, name: str) -> bool:
+        """Check whether this ffmpeg build provides an encoder (e.g. "h264_nvenc")."""
+        return name in list_encoders(self.ffmpeg_path)
+
+    def probe(
+        self,
+        input_file: Union[str, Path],
+        show_entries: Optional[str] = None,
+        extra_args: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get media file information using ffprobe.
+
+        Args:
+            input_file: Path to media file
+            show_entries: Optional ffprobe -show_entries spec limiting the output to the listed
+                fields (e.g. "stream=codec_type:format=duration"). Defaults to all stream and
+                format fields.
+            extra_args: Optional ffprobe input options placed before the file, such as
+                ["-probesize", "500000"]
+        """
+        cmd = [self.ffprobe_path, "-v", "error", "-print_format", "json"]
+        if extra_args:
+            cmd.extend(extra_args)
+        if show_entries:
+            cmd.extend(["-show_entries", show_entries])
+        else:
+            cmd.extend(["-show_format", "-show_streams"])
+        cmd.append(str(input_file))
 
         try:
             result = self._run_command(cmd)
@@ -78,6 +140,40 @@ class FFmpegWrapper:
             self.logger.error(f"Probe failed: {str(e)}")
             raise FFprobeError(f"Probe failed: {str(e)}")
 
+    def probe_many(
+        self,
+        input_files: List[Union[str, Path]],
+        max_workers: int = 4,
+        show_entries: Optional[str] = None,
+        extra_args: Optional[List[str]] = None,
+    ) -> Dict[Path, Dict[str, Any]]:
+        """Probe several media files concurrently.
+
+        Args:
+            input_files: Paths to media files
+            max_workers: Maximum number of concurrent ffprobe processes
+            show_entries: Optional ffprobe -show_entries spec, see probe()
+            extra_args: Optional ffprobe input options used for every file, see probe()
+
+        Returns:
+            Dictionary mapping each successfully probed path to its probe data.
+            Files that fail to probe are left out so callers can fall back to probe().
+        """
+        paths = [Path(f) for f in input_files]
+        if not paths:
+            return {}
+
+        results: Dict[Path, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+            futures = [(p, executor.submit(self.probe, p, show_entries, extra_args)) for p in paths]
+            for path, future in futures:
+                try:
+                    results[path] = future.result()
+                except FFprobeError as e:
+                    self.logger.warning(f"Failed to probe {path}: {e}")
+
+        return results
+
     def get_video_info(self, input_file: Union[str, Path]) -> Dict[str, Any]:
         """Extract relevant video information.
 
@@ -207,7 +303,8 @@ class FFmpegWrapper:
         cmd = self.build_conversion_command(input_file, output_file, encoding_config, options)
 
         self.logger.info(f"Starting conversion: {input_file} -> {output_file}")
-        self.logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
         if options.dry_run:
             self.logger.info("Dry run - skipping conversion")
@@ -219,6 +316,8 @@ class FFmpegWrapper:
             )
 
             duration = self.get_video_info(input_file)["duration"]
+            # ffmpeg writes a status line per frame; avoid formatting them at INFO level
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
             # Process output in real-time
             while True:
@@ -231,7 +330,8 @@ class FFmpegWrapper:
                     break
 
                 if output:
-                    self.logger.debug(output.strip())
+                    if debug_enabled:
+                        self.logger.debug(output.strip())
 
                     # Parse progress if callback provided
                     if progress_callback and "time=" in output:
@@ -242,7 +342,7 @@ class FFmpegWrapper:
                             progress = min(current_time / duration * 100, 100)
                             progress_callback(progress)
                         except Exception as e:
-                            self.logger.debug(f"Failed to parse progress: {e}")
+                            self.logger.debug("Failed to parse progress: %s", e)
 
             if process.returncode != 0:
                 raise FFmpegError(f"FFmpeg conversion failed with return code {process.returncode}")
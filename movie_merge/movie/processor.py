@@ -2,20 +2,28 @@
 
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from movie_merge.constants import VIDEO_EXTENSIONS
 
-from ..clip.processor import Clip
+from ..clip._metadata_cache import get_metadata_cache
+from ..clip.processor import CLIP_PROBE_ENTRIES, QUICK_PROBE_ARGS, QUICK_PROBE_EXTENSIONS, Clip
 from ..config.directory import DirectoryConfig
 from ..config.processing import ProcessingConfig
 from ..config.sort import SortMethod
-from ..ffmepg.wrapper import FFmpegWrapper
-from ..utils.logging import LoggingContext, set_movie_context, set_clip_context
+from ..ffmepg.wrapper import FFmpegWrapper, get_default_ffmpeg
+from ..utils.logging import (
+    LoggingContext,
+    movie_context,
+    set_clip_context,
+    set_movie_context,
+    thread_context,
+)
 from ..utils.file import should_ignore_directory
 
 logger = logging.getLogger(__name__)
@@ -44,15 +52,22 @@ class Chapter:
 class Movie:
     """Handles movie processing and compilation."""
 
-    def __init__(self, directory: Path, proc_config: ProcessingConfig, dir_config: DirectoryConfig):
+    def __init__(
+        self,
+        directory: Path,
+        proc_config: ProcessingConfig,
+        dir_config: DirectoryConfig,
+        ffmpeg: Optional[FFmpegWrapper] = None,
+    ):
         """Initialize movie processor.
 
         Args:
             directory: Movie directory path
             proc_config: Processing configuration
             dir_config: Directory configuration
+            ffmpeg: FFmpegWrapper shared with the movie's clips (defaults to the shared instance)
         """
-        self._ffmpeg: FFmpegWrapper = FFmpegWrapper()
+        self._ffmpeg: FFmpegWrapper = ffmpeg or get_default_ffmpeg()
         self.proc_config = proc_config
         self.dir_config = dir_config
         self.chapters: List[Chapter] = []
@@ -139,31 +154,90 @@ class Movie:
                     logger.exception("Detailed error:")
                 raise
 
+    def _prefetch_probe_data(self, video_files: List[Path]) -> Dict[Path, Dict[str, Any]]:
+        """Probe video files in one batch."""
+        if not video_files:
+            return {}
+
+        # ffprobe processes mostly wait on disk, so use at least one worker per CPU even
+        # when encoding is limited to fewer threads
+        max_workers = max(self.proc_config.options.threads, os.cpu_count() or 1)
+        logger.debug(f"Prefetching probe data for {len(video_files)} clips")
+
+        # MP4/MOV files can be probed with a much smaller probe size than other containers
+        quick_files = [f for f in video_files if f.suffix.lower() in QUICK_PROBE_EXTENSIONS]
+        other_files = [f for f in video_files if f.suffix.lower() not in QUICK_PROBE_EXTENSIONS]
+        probe_data = self._ffmpeg.probe_many(
+            quick_files,
+            max_workers=max_workers,
+            show_entries=CLIP_PROBE_ENTRIES,
+            extra_args=QUICK_PROBE_ARGS,
+        )
+        probe_data.update(
+            self._ffmpeg.probe_many(
+                other_files, max_workers=max_workers, show_entries=CLIP_PROBE_ENTRIES
+            )
+        )
+        return probe_data
+
     def _process_clips_in_directory(self, directory: Path) -> List[Clip]:
         """Process all video files in a directory."""
-        # First pass: Create clips without metadata extraction
-        clips = []
+        video_files = []
         for ext in VIDEO_EXTENSIONS:
             pattern = f"*{ext}"
             for video_file in directory.glob(pattern, case_sensitive=False):
-                if video_file.parent.name != "original":
-                    video_file_path = Path(video_file)
-                    logger.debug(f"Found clip: {video_file.name}")
-                    try:
-                        # Create clip without extracting metadata yet
-                        clip = Clip(
-                            video_file_path,
-                            self.proc_config,
-                            self.dir_config,
-                            extract_metadata=False,
-                        )
-                        clips.append(clip)
-                        logger.debug(f"Successfully created clip object for: {video_file}")
-                    except Exception as e:
-                        logger.error(f"Failed to create clip for {video_file}: {e}")
-                        if logger.isEnabledFor(logging.DEBUG):
-                            logger.exception("Detailed error:")
-                        continue
+                # Dot files include leftover .tmp_ conversions from an interrupted run
+                if video_file.parent.name != "original" and not video_file.name.startswith("."):
+                    logger.debug("Found clip: %s", video_file.name)
+                    video_files.append(Path(video_file))
+
+        # Probe and read dates for all uncached files up front so clips don't each
+        # spawn ffprobe and exiftool on their own
+        # Each file is stat'ed once here and the result is reused by its Clip
+        cache = get_metadata_cache(self.proc_config.options.temp_dir)
+        file_stats = {}
+        for video_file in video_files:
+            try:
+                file_stats[video_file] = video_file.stat()
+            except OSError as e:
+                logger.error(f"Failed to stat {video_file}: {e}")
+        video_files = list(file_stats)
+        uncached_files = [
+            f
+            for f, stats in file_stats.items()
+            if not cache or cache.get(f, stats, key="metadata") is None
+        ]
+        # Files without a capture date only have their probe output cached
+        unprobed_files = [
+            f
+            for f in uncached_files
+            if not cache or cache.get(f, file_stats[f], key="probe") is None
+        ]
+        probe_data = self._prefetch_probe_data(unprobed_files)
+        exif_dates = Clip.prewarm_exif(uncached_files)
+
+        # First pass: Create clips without metadata extraction
+        clips = []
+        for video_file in video_files:
+            try:
+                # Create clip without extracting metadata yet
+                clip = Clip(
+                    video_file,
+                    self.proc_config,
+                    self.dir_config,
+                    extract_metadata=False,
+                    probe_data=probe_data.get(video_file),
+                    exif_dates=exif_dates or None,
+                    ffmpeg=self._ffmpeg,
+                    stat_result=file_stats[video_file],
+                )
+                clips.append(clip)
+                logger.debug("Successfully created clip object for: %s", video_file)
+            except Exception as e:
+                logger.error(f"Failed to create clip for {video_file}: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.exception("Detailed error:")
+                continue
 
         if not clips:
             return []
@@ -188,9 +262,10 @@ class Movie:
                 try:
                     processed_clip = future.result()
                     successful_clips.append(processed_clip)
-                    logger.debug(
-                        f"Clip metadata: {json.dumps(processed_clip.to_dict(), indent=2, ensure_ascii=False)}"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Clip metadata: {json.dumps(processed_clip.to_dict(), indent=2, ensure_ascii=False)}"
+                        )
                 except Exception as e:
                     logger.error(f"Failed to extract metadata for {clip.path}: {e}")
                     # Don't include clips that failed metadata extraction
@@ -199,6 +274,8 @@ class Movie:
         logger.info(
             f"Successfully extracted metadata for {len(successful_clips)}/{len(clips)} clips"
         )
+        if cache:
+            cache.flush()
 
         # Sort clips based on configuration
         sorted_clips = self._sort_clips(successful_clips) if successful_clips else []
@@ -264,6 +341,32 @@ class Movie:
         logger.info(f"Found {len(self.chapters)} chapters in total")
         logger.debug("Chapters: " + ", ".join(chapter.title for chapter in self.chapters))
 
+    def _process_clip(
+        self, chapter: Chapter, clip: Clip, movie: Optional[str], thread: Optional[str]
+    ) -> None:
+        """Convert a clip and create its title card if it opens the chapter.
+
+        Runs on a worker thread, which doesn't inherit the caller's logging context, so the
+        caller's movie and thread names are passed in and set again here.
+        """
+        with LoggingContext(movie=movie, thread=thread):
+            # Convert video to MP4 format
+            clip.convert_to_mp4(target_fps=self.target_fps)
+
+            # Create title card for the first clip in each chapter
+            if clip.is_title:
+                # Create title with matching FPS, using short segment
+                title_clip = clip.create_title(
+                    chapter.title,
+                    chapter.description,
+                    location=self.dir_config.metadata.location,
+                    title_config=self.dir_config.title_config,
+                    use_segment=True,
+                )
+                chapter.clips[0] = title_clip
+                # Mark the clip as a title clip
+                chapter.clips[0].is_title_clip = True
+
     def process(self):
         """Process movie clips and create title cards."""
         # Scan directory for clips and organize into chapters
@@ -280,30 +383,37 @@ class Movie:
 
         logger.info(f"Using target framerate: {self.target_fps} FPS")
 
-        # Process each chapter
+        # Update title card config with target FPS
+        self.dir_config.title_config.fps = self.target_fps
+
+        # Process each chapter. Clips are independent ffmpeg jobs, so run several at once.
+        # Up to max_concurrent_movies movies do this at the same time, so split the CPU
+        # cores between them and let each encoder use its configured thread count.
         logger.info("Processing chapters.")
-        for chapter in self.chapters:
-            for clip in chapter.clips:
-                # Convert video to MP4 format
-                clip.convert_to_mp4(target_fps=self.target_fps)
-
-                # Create title card for the first clip in each chapter
-                if clip.is_title:
-                    # Update title card config with target FPS
-                    chapter_title_config = self.dir_config.title_config
-                    chapter_title_config.fps = self.target_fps
-
-                    # Create title with matching FPS, using short segment
-                    title_clip = clip.create_title(
-                        chapter.title,
-                        chapter.description,
-                        location=self.dir_config.metadata.location,
-                        title_config=chapter_title_config,
-                        use_segment=True,
-                    )
-                    chapter.clips[0] = title_clip
-                    # Mark the clip as a title clip
-                    chapter.clips[0].is_title_clip = True
+        options = self.proc_config.options
+        jobs = [(chapter, clip) for chapter in self.chapters for clip in chapter.clips]
+        max_workers = max(
+            1,
+            min(
+                len(jobs),
+                (os.cpu_count() or 1) // (options.threads * options.max_concurrent_movies),
+            ),
+        )
+        logger.debug(f"Using {max_workers} threads for clip processing")
+
+        movie, thread = movie_context.get(), thread_context.get()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._process_clip, chapter, clip, movie, thread)
+                for chapter, clip in jobs
+            ]
+            # Once a clip fails the movie can't be made, so don't start the queued encodes
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in futures:
+                if not future.cancelled():
+                    future.result()
 
         # Flatten all clips into single list
         for chapter in self.chapters:
@@ -321,9 +431,9 @@ class Movie:
         logger.info(f"Using target framerate: {self.target_fps} FPS")
 
         try:
-            # Prepare clips for merging
-            original_clips = []
-            scaled_clips = []
+            # Prepare clips for merging as (path, start offset in seconds)
+            original_clips: List[Tuple[Path, float]] = []
+            scaled_clips: List[Tuple[Path, float]] = []
             temp_files = []
 
             for clip in self.clips:
@@ -334,7 +444,7 @@ class Movie:
                     and hasattr(clip, "original_path")
                 ):
                     # Add the title segment
-                    original_clips.append(clip.path)
+                    original_clips.append((clip.path, 0.0))
 
                     original_clip = clip.original_path
                     original_metadata = clip._extract_metadata(original_clip)
@@ -343,39 +453,20 @@ class Movie:
                     used_duration = clip.metadata.duration
 
                     if original_metadata and original_metadata.duration > used_duration:
-                        # Create temporary clip with the remainder, starting exactly where the title clip ends
-                        temp_remainder = (
-                            self.proc_config.options.temp_dir / f"remainder_{original_clip.name}"
-                        )
-
-                        cmd = [
-                            self._ffmpeg.ffmpeg_path,
-                            "-y",
-                            "-ss",
-                            str(used_duration),
-                            "-i",
-                            str(original_clip),
-                            "-c:v",
-                            self.proc_config.encoding.video_codec.value,
-                            "-c:a",
-                            self.proc_config.encoding.audio_codec.value,
-                            str(temp_remainder),
-                        ]
-
-                        if not self.proc_config.options.dry_run:
-                            self._ffmpeg._run_command(cmd)
-                            original_clips.append(temp_remainder)
-                            temp_files.append(temp_remainder)
+                        # Add the remainder of the original clip, starting exactly where the
+                        # title clip ends. The final encode seeks into it directly, so no
+                        # intermediate remainder file is encoded.
+                        original_clips.append((original_clip, used_duration))
                 else:
                     # For regular clips, use them as is
-                    original_clips.append(clip.path)
+                    original_clips.append((clip.path, 0.0))
 
             # Check if all clips have the same dimensions
             same_dimensions = True
             reference_width = None
             reference_height = None
 
-            for clip_path in original_clips:
+            for clip_path, _ in original_clips:
                 # Get clip dimensions
                 try:
                     info = self._ffmpeg.get_video_info(clip_path)
@@ -407,7 +498,7 @@ class Movie:
             else:
                 logger.info("Clips have different dimensions. Performing scaling.")
                 # Create uniformly scaled versions of all clips with padding
-                for i, clip_path in enumerate(original_clips):
+                for i, (clip_path, start) in enumerate(original_clips):
                     # Create a temporary scaled version with letterbox/pillarbox as needed
                     scaled_temp = self.proc_config.options.temp_dir / f"scaled_{i}_{clip_path.name}"
 
@@ -419,12 +510,15 @@ class Movie:
                     scale_cmd = [
                         self._ffmpeg.ffmpeg_path,
                         "-y",
+                        *(["-ss", str(start)] if start else []),
                         "-i",
                         str(clip_path),
                         "-vf",
                         f"scale={width}:{height}:force_original_aspect_ratio=1,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1",
                         "-c:v",
                         self.proc_config.encoding.video_codec.value,
+                        "-threads",
+                        str(self.proc_config.options.threads),
                         "-c:a",
                         "copy",
                         str(scaled_temp),
@@ -432,7 +526,7 @@ class Movie:
 
                     if not self.proc_config.options.dry_run:
                         self._ffmpeg._run_command(scale_cmd)
-                        scaled_clips.append(scaled_temp)
+                        scaled_clips.append((scaled_temp, 0.0))
                         temp_files.append(scaled_temp)
                     else:
                         logger.info(f"Would create scaled version of {clip_path} → {scaled_temp}")
@@ -440,8 +534,10 @@ class Movie:
             # Build ffmpeg command with complex filter for concatenation
             cmd = [self._ffmpeg.ffmpeg_path, "-y"]
 
-            # Add input files
-            for path in scaled_clips:
+            # Add input files, seeking into clips that continue after a title segment
+            for path, start in scaled_clips:
+                if start:
+                    cmd.extend(["-ss", str(start)])
                 cmd.extend(["-i", str(path)])
 
             # Build filter complex string for proper concatenation
@@ -527,7 +623,8 @@ class Movie:
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
             if not self.proc_config.options.dry_run:
-                logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
                 self._ffmpeg._run_command(cmd)
                 logger.info(f"Successfully created movie: {output_file}")
 
@@ -540,7 +637,8 @@ class Movie:
                         logger.warning(f"Failed to remove temporary file {temp_file}: {e}")
             else:
                 logger.info(f"Would create movie: {output_file}")
-                logger.debug(f"Would run: {' '.join(cmd)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Would run: {' '.join(cmd)}")
 
         except Exception as e:
             logger.error(f"Failed to create movie: {e}")
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -10,6 +11,7 @@ from typing import Dict, Generator, List, Optional, Tuple
 from ..config.directory import DirectoryConfig, parse_directory_config
 from ..config.exceptions import DirectoryParseError
 from ..config.processing import ProcessingConfig
+from ..ffmepg.wrapper import get_default_ffmpeg
 from ..movie.processor import Movie
 from ..utils.file import should_ignore_directory, verify_writeable_directory
 from ..utils.logging import LoggingContext, set_thread_context, clear_all_context
@@ -28,6 +30,10 @@ class Project:
         if not self.config.input_path.exists():
             raise DirectoryParseError(f"Root directory does not exist: {self.config.input_path}")
 
+        # Dry runs only report what would be done, so don't create any directories
+        if config.options.dry_run:
+            return
+
         # Verify/create output directory
         verify_writeable_directory(config.output_path, create=True)
 
@@ -42,6 +48,7 @@ class Project:
             logger.warning(f"Year directory does not exist: {year_dir}")
             return
 
+        event_dirs = []
         for event_dir in sorted(year_dir.iterdir()):
             if not event_dir.is_dir():
                 continue
@@ -50,31 +57,60 @@ class Project:
                 logger.info(f"Ignoring directory (found .reelignore): {event_dir}")
                 continue
 
-            try:
-                config = parse_directory_config(event_dir)
-                yield event_dir, config
-            except DirectoryParseError as e:
-                logger.error(f"Failed to parse directory {event_dir}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error processing directory {event_dir}: {e}")
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Traceback:")
-                continue
+            event_dirs.append(event_dir)
+
+        if not event_dirs:
+            return
+
+        # Parsing is dominated by stat/read latency, so overlap it across directories.
+        # map() keeps results in directory order.
+        max_workers = min(len(event_dirs), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for event_dir, config in zip(
+                event_dirs, executor.map(self._parse_event_dir, event_dirs)
+            ):
+                if config is not None:
+                    yield event_dir, config
+
+    @staticmethod
+    def _parse_event_dir(event_dir: Path) -> Optional[DirectoryConfig]:
+        """Parse an event directory's config, logging and returning None on failure."""
+        try:
+            return parse_directory_config(event_dir)
+        except DirectoryParseError as e:
+            logger.error(f"Failed to parse directory {event_dir}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error processing directory {event_dir}: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.exception("Traceback:")
+        return None
 
     def process(self, year: str) -> None:
         """Process all events for a specific year."""
-        logger.info(f"Processing year: {year}")
+        self.process_years([year])
 
-        # Create year output directory
-        year_output = self.config.output_path / year
-        year_output.mkdir(parents=True, exist_ok=True)
+    def process_years(self, years: List[str]) -> None:
+        """Process all events for several years.
 
-        # Collect all directories to process
-        directories_to_process = list(self.scan_year(year))
+        Event directories from every year share one worker pool, so years are processed
+        concurrently without exceeding max_concurrent_movies.
+        """
+        directories_to_process: List[Tuple[Path, DirectoryConfig]] = []
+        for year in years:
+            logger.info(f"Processing year: {year}")
+
+            # Create year output directory
+            if not self.config.options.dry_run:
+                year_output = self.config.output_path / year
+                year_output.mkdir(parents=True, exist_ok=True)
+
+            # Collect all directories to process
+            year_directories = list(self.scan_year(year))
+            if not year_directories:
+                logger.info(f"No directories found to process for year {year}")
+            directories_to_process.extend(year_directories)
 
         if not directories_to_process:
-            logger.info(f"No directories found to process for year {year}")
             return
 
         # Determine processing mode
@@ -164,25 +200,36 @@ class Project:
                 logger.exception("Traceback:")
             return False
 
+    def _output_file(self, dir_config: DirectoryConfig) -> Path:
+        """Get the output movie path for an event directory."""
+        # Include location in filename if available
+        if dir_config.metadata.location:
+            filename = f"{dir_config.title} - {dir_config.metadata.location}.mp4"
+        else:
+            filename = f"{dir_config.title}.mp4"
+        return self.config.output_path / str(dir_config.metadata.year) / filename
+
     def _process_directory(self, directory: Path, dir_config: DirectoryConfig) -> None:
         """Process a single event directory."""
         logger.info(f"Processing directory: {directory}")
 
         if self.config.options.dry_run:
-            logger.info(f"Dry run - would process {directory}")
+            # Report the plan without creating a Movie, so no clip is probed
+            output_file = self._output_file(dir_config)
+            logger.info(f"Dry run - would process {directory} -> {output_file}")
+            if output_file.exists():
+                if self.config.options.overwrite:
+                    logger.info(f"Would overwrite existing file: {output_file}")
+                else:
+                    logger.info(f"Output file already exists, would skip: {output_file}")
             return
 
         try:
-            # Create movie processor
-            movie = Movie(directory, self.config, dir_config)
+            # Create movie processor, sharing one FFmpegWrapper across all movies and clips
+            movie = Movie(directory, self.config, dir_config, ffmpeg=get_default_ffmpeg())
 
             # Determine the output file path
-            # Include location in filename if available
-            if movie.metadata.location:
-                filename = f"{movie.title} - {movie.metadata.location}.mp4"
-            else:
-                filename = f"{movie.title}.mp4"
-            output_file = self.config.output_path / str(movie.metadata.year) / filename
+            output_file = self._output_file(dir_config)
 
             # Check if the output file already exists
             if output_file.exists() and not self.config.options.overwrite:
@@ -193,12 +240,6 @@ class Project:
             # Create output directory if needed
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            if self.config.options.dry_run:
-                logger.info(f"Dry run - would process {directory}")
-                if output_file.exists():
-                    logger.info(f"Would overwrite existing file: {output_file}")
-                return
-
             # Scan for video files and process
             movie.process()
 
@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 from pathlib import Path
 from typing import List, Union
 
@@ -170,8 +171,6 @@ def safe_filename(filename: str) -> str:
     # Check if filename starts with a date pattern (YYYY-MM-DD)
     date_prefix = None
     date_pattern = r"^(\d{4}-\d{2}-\d{2})"
-    import re
-
     date_match = re.match(date_pattern, filename)
     if date_match:
         date_prefix = date_match.group(1)
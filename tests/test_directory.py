@@ -0,0 +1,23 @@
+"""Tests for date parsing in movie_merge.config.directory."""
+
+from datetime import date, datetime
+
+import pytest
+
+from movie_merge.config.directory import _parse_date
+
+
+def test_parse_date_string():
+    assert _parse_date("2024-06-01") == datetime(2024, 6, 1)
+
+
+def test_parse_date_from_yaml_date():
+    assert _parse_date(date(2024, 6, 1)) == datetime(2024, 6, 1)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["20240601", "2024-W22-6", "2024-06-01T10:00", "2024-6-1", "2024-02-30", 20240601],
+)
+def test_parse_date_rejects_other_formats(value):
+    assert _parse_date(value) is None
@@ -0,0 +1,106 @@
+"""Tests for the exiftool stay_open daemon, using a fake exiftool executable."""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from movie_merge.clip import _exiftool_daemon
+from movie_merge.clip._exiftool_daemon import ExiftoolDaemon, read_datetime_original
+
+DAEMON_DATE = "2024-06-01 12:00:00+0200"
+ONE_SHOT_DATE = "2020-01-01 00:00:00+0000"
+
+# Speaks the subset of exiftool's -stay_open protocol the daemon uses. Files named
+# "nodate" have no DateTimeOriginal and reading a file named "crash" kills the process.
+FAKE_EXIFTOOL = textwrap.dedent(f"""\
+    #!{sys.executable}
+    import sys
+
+    args = sys.argv[1:]
+    if "-stay_open" not in args:
+        if "nodate" not in args[-1]:
+            print("{ONE_SHOT_DATE}")
+        sys.exit(0)
+
+    pending = []
+    for line in sys.stdin:
+        line = line.rstrip("\\n")
+        if pending == ["-stay_open"] and line == "False":
+            sys.exit(0)
+        if not line.startswith("-execute"):
+            pending.append(line)
+            continue
+        for path in pending:
+            if "crash" in path:
+                sys.exit(1)
+            if "nodate" not in path:
+                print("{DAEMON_DATE}")
+        print("{{ready" + line[len("-execute"):] + "}}", flush=True)
+        pending = []
+    """)
+
+
+@pytest.fixture
+def fake_exiftool(tmp_path, monkeypatch):
+    executable = tmp_path / "exiftool"
+    executable.write_text(FAKE_EXIFTOOL, encoding="utf-8")
+    executable.chmod(0o755)
+
+    monkeypatch.setattr(_exiftool_daemon, "find_executable", lambda name: str(executable))
+    monkeypatch.setattr(_exiftool_daemon, "_daemon", None)
+    yield str(executable)
+
+    if _exiftool_daemon._daemon is not None:
+        _exiftool_daemon._daemon.close()
+
+
+def test_reads_date(fake_exiftool):
+    daemon = ExiftoolDaemon.instance()
+
+    assert daemon.get_datetime_original(Path("/videos/clip.mp4")) == DAEMON_DATE
+    assert daemon.get_datetime_original(Path("/videos/other.mp4")) == DAEMON_DATE
+
+
+def test_file_without_date(fake_exiftool):
+    daemon = ExiftoolDaemon.instance()
+
+    assert daemon.get_datetime_original(Path("/videos/nodate.mp4")) is None
+    # The next request is still framed correctly
+    assert daemon.get_datetime_original(Path("/videos/clip.mp4")) == DAEMON_DATE
+
+
+def test_instance_is_shared(fake_exiftool):
+    assert ExiftoolDaemon.instance() is ExiftoolDaemon.instance()
+
+
+def test_restarts_after_process_dies(fake_exiftool):
+    daemon = ExiftoolDaemon.instance()
+
+    assert daemon.get_datetime_original(Path("/videos/crash.mp4")) is None
+    daemon._process.wait(timeout=5)
+    assert not daemon.is_running()
+
+    restarted = ExiftoolDaemon.instance()
+    assert restarted is not daemon
+    assert restarted.get_datetime_original(Path("/videos/clip.mp4")) == DAEMON_DATE
+
+
+def test_path_with_newline_uses_one_shot_run(fake_exiftool):
+    daemon = ExiftoolDaemon.instance()
+
+    assert daemon.get_datetime_original(Path("/videos/two\nlines.mp4")) == ONE_SHOT_DATE
+    # The daemon never saw the path, so its framing is intact
+    assert daemon.get_datetime_original(Path("/videos/clip.mp4")) == DAEMON_DATE
+
+
+def test_one_shot_without_date(fake_exiftool):
+    assert read_datetime_original(fake_exiftool, Path("/videos/nodate.mp4")) is None
+
+
+def test_instance_without_exiftool(monkeypatch):
+    monkeypatch.setattr(_exiftool_daemon, "find_executable", lambda name: None)
+    monkeypatch.setattr(_exiftool_daemon, "_daemon", None)
+
+    assert ExiftoolDaemon.instance() is None
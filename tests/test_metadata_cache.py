@@ -0,0 +1,158 @@
+"""Tests for the persistent clip metadata cache and ClipMetadata serialization."""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from movie_merge.clip._metadata_cache import CACHE_FILE, MetadataCache, get_metadata_cache
+from movie_merge.clip.processor import ClipMetadata
+
+
+def make_file(tmp_path, name="clip.mp4", content=b"video"):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def test_get_hit_while_file_unchanged(tmp_path):
+    video = make_file(tmp_path)
+    cache = MetadataCache(tmp_path / CACHE_FILE)
+    stats = os.stat(video)
+
+    cache.put(video, stats, probe={"format": {}})
+
+    assert cache.get(video, os.stat(video)) == {"format": {}}
+    assert cache.get(video, stats, key="metadata") is None
+
+
+def test_get_miss_on_mtime_change(tmp_path):
+    video = make_file(tmp_path)
+    cache = MetadataCache(tmp_path / CACHE_FILE)
+    cache.put(video, os.stat(video), probe={"format": {}})
+
+    mtime_ns = os.stat(video).st_mtime_ns + 1_000_000_000
+    os.utime(video, ns=(mtime_ns, mtime_ns))
+
+    assert cache.get(video, os.stat(video)) is None
+
+
+def test_get_miss_on_size_change(tmp_path):
+    video = make_file(tmp_path)
+    stats = os.stat(video)
+    cache = MetadataCache(tmp_path / CACHE_FILE)
+    cache.put(video, stats, probe={"format": {}})
+
+    video.write_bytes(b"longer video")
+    os.utime(video, ns=(stats.st_atime_ns, stats.st_mtime_ns))
+
+    assert cache.get(video, os.stat(video)) is None
+
+
+def test_put_replaces_stale_entry(tmp_path):
+    video = make_file(tmp_path)
+    cache = MetadataCache(tmp_path / CACHE_FILE)
+    cache.put(video, os.stat(video), probe={"old": True}, metadata={"old": True})
+
+    video.write_bytes(b"re-encoded video")
+    new_stats = os.stat(video)
+    cache.put(video, new_stats, probe={"new": True})
+
+    assert cache.get(video, new_stats) == {"new": True}
+    # Values from the stale entry must not survive next to the new ones
+    assert cache.get(video, new_stats, key="metadata") is None
+
+
+def test_put_merges_values_for_unchanged_file(tmp_path):
+    video = make_file(tmp_path)
+    stats = os.stat(video)
+    cache = MetadataCache(tmp_path / CACHE_FILE)
+
+    cache.put(video, stats, probe={"format": {}})
+    cache.put(video, stats, metadata={"name": "clip"})
+
+    assert cache.get(video, stats) == {"format": {}}
+    assert cache.get(video, stats, key="metadata") == {"name": "clip"}
+
+
+def test_flush_writes_atomically_and_clears_dirty(tmp_path, monkeypatch):
+    video = make_file(tmp_path)
+    cache_file = tmp_path / CACHE_FILE
+    cache = MetadataCache(cache_file)
+    stats = os.stat(video)
+    cache.put(video, stats, probe={"format": {}})
+
+    replaced = []
+    real_replace = os.replace
+
+    def record_replace(src, dst):
+        replaced.append((src, dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", record_replace)
+    cache.flush()
+
+    assert len(replaced) == 1
+    temp_file, target = replaced[0]
+    assert target == cache_file
+    assert temp_file != cache_file and not temp_file.exists()
+    assert json.loads(cache_file.read_text(encoding="utf-8"))[str(video)]["probe"] == {"format": {}}
+
+    # Nothing changed since the last flush, so nothing is written
+    cache.flush()
+    assert len(replaced) == 1
+
+    # A fresh cache reads the flushed entries back
+    assert MetadataCache(cache_file).get(video, stats) == {"format": {}}
+
+
+def test_corrupt_cache_file_is_ignored(tmp_path):
+    video = make_file(tmp_path)
+    cache_file = tmp_path / CACHE_FILE
+    cache_file.write_text("{not json", encoding="utf-8")
+
+    cache = MetadataCache(cache_file)
+
+    assert cache.get(video, os.stat(video)) is None
+    cache.put(video, os.stat(video), probe={"format": {}})
+    cache.flush()
+    assert json.loads(cache_file.read_text(encoding="utf-8"))[str(video)]["probe"] == {"format": {}}
+
+
+def test_non_dict_cache_file_is_ignored(tmp_path):
+    cache_file = tmp_path / CACHE_FILE
+    cache_file.write_text("[1, 2, 3]", encoding="utf-8")
+
+    cache = MetadataCache(cache_file)
+
+    assert cache.get(make_file(tmp_path), os.stat(tmp_path / "clip.mp4")) is None
+
+
+def test_get_metadata_cache_is_shared_per_directory(tmp_path):
+    assert get_metadata_cache(None) is None
+    assert get_metadata_cache(tmp_path) is get_metadata_cache(tmp_path)
+
+
+def test_clip_metadata_round_trip_with_aware_date():
+    metadata = ClipMetadata(
+        creation_date=datetime(2024, 6, 1, 14, 30, 5, tzinfo=timezone(timedelta(hours=2))),
+        duration=12.5,
+        frame_rate=29.97,
+        video_codec="h264",
+        width=1920,
+        height=1080,
+        video_bitrate=8_000_000,
+        audio_codec="aac",
+        audio_channels=2,
+        audio_bitrate=128_000,
+        audio_sample_rate=48000,
+        file_size=12_345_678,
+        format="mov,mp4,m4a,3gp,3g2,mj2",
+        name="clip",
+        extension=".mp4",
+    )
+
+    # Go through JSON, as the cache file does
+    restored = ClipMetadata.from_dict(json.loads(json.dumps(metadata.to_dict())))
+
+    assert restored == metadata
+    assert restored.creation_date.utcoffset() == timedelta(hours=2)
@@ -0,0 +1,127 @@
+"""Tests for the ffmpeg title card pipeline in movie_merge.clip.title."""
+
+from PIL import Image
+
+from movie_merge.clip.title import TitleCardConfig, TitleConfig, TitleCardGenerator
+
+# Missing on purpose, so rendering uses Pillow's bundled default font on every machine
+MISSING_FONT = "/nonexistent/font.ttf"
+
+
+def make_generator(video_size=(200, 100)):
+    generator = TitleCardGenerator()
+    generator._video_size = video_size
+    return generator
+
+
+def test_filter_graph_without_text():
+    generator = make_generator()
+    assert generator._build_filter_graph(None, TitleCardConfig()) == "[0:v]null[vout]"
+
+
+def test_filter_graph_with_position():
+    generator = make_generator()
+    config = TitleCardConfig(duration=7.0, fade_duration=2.0)
+    position = "x='(W-200)/2+20':y='(H-100)/2+30'"
+
+    assert generator._build_filter_graph(position, config) == (
+        "[1:v]format=rgba,fade=t=in:st=0:d=2.0:alpha=1,fade=t=out:st=5.0:d=2.0:alpha=1[text];"
+        "[0:v][text]overlay=x='(W-200)/2+20':y='(H-100)/2+30':eof_action=pass[vout]"
+    )
+
+
+def test_filter_graph_fade_longer_than_duration():
+    generator = make_generator()
+    config = TitleCardConfig(duration=1.0, fade_duration=2.0)
+
+    graph = generator._build_filter_graph("x=0:y=0", config)
+
+    assert "fade=t=out:st=0.0:d=2.0:alpha=1" in graph
+
+
+def test_encoder_args_libx264():
+    generator = make_generator()
+    assert generator._encoder_args("libx264", "slow", 3, 21) == [
+        "-c:v",
+        "libx264",
+        "-preset",
+        "slow",
+        "-crf",
+        "21",
+        "-threads",
+        "3",
+    ]
+
+
+def test_encoder_args_nvenc():
+    generator = make_generator()
+    assert generator._encoder_args("h264_nvenc", "fast", 3, 19) == [
+        "-c:v",
+        "h264_nvenc",
+        "-preset",
+        "p3",
+        "-tune",
+        "hq",
+        "-rc",
+        "vbr",
+        "-cq",
+        "19",
+        "-b:v",
+        "0",
+    ]
+
+
+def test_encoder_args_nvenc_unknown_preset():
+    generator = make_generator()
+    args = generator._encoder_args("h264_nvenc", "placebo", 3, 19)
+    assert args[args.index("-preset") + 1] == "p4"
+
+
+def test_fuse_overlays_without_text():
+    generator = make_generator()
+    assert generator._fuse_overlays([]) is None
+
+
+def test_fuse_overlays_crops_to_overlays():
+    generator = make_generator()
+    overlays = [
+        (Image.new("RGBA", (10, 5), "white"), (20, 30)),
+        (Image.new("RGBA", (4, 4), "white"), (50, 60)),
+    ]
+
+    image, position = generator._fuse_overlays(overlays)
+
+    assert image.size == (34, 34)
+    assert position == "x='(W-200)/2+20':y='(H-100)/2+30'"
+
+
+def test_fuse_overlays_shadow_extends_crop():
+    generator = make_generator(video_size=(400, 200))
+    plain = generator._render_text("Title", TitleConfig(font=MISSING_FONT, font_shadow=False))
+    shadowed = generator._render_text("Title", TitleConfig(font=MISSING_FONT, font_shadow=True))
+    shadow_offset = max(1, TitleConfig().font_size // 25)
+
+    assert shadowed.size == (plain.width + shadow_offset, plain.height + shadow_offset)
+
+    plain_image, plain_position = generator._fuse_overlays([(plain, (40, 50))])
+    shadow_image, shadow_position = generator._fuse_overlays([(shadowed, (40, 50))])
+
+    # The shadow is drawn below and to the right, so the crop keeps its top-left corner
+    # and grows by the shadow offset
+    assert shadow_position == plain_position
+    assert shadow_image.size == (
+        plain_image.width + shadow_offset,
+        plain_image.height + shadow_offset,
+    )
+
+
+def test_fuse_overlays_background_covers_frame():
+    generator = make_generator()
+    overlays = [(Image.new("RGBA", (10, 5), "white"), (20, 30))]
+
+    image, position = generator._fuse_overlays(overlays, background_opacity=0.4)
+
+    assert image.size == (200, 100)
+    assert position == "x='(W-200)/2+0':y='(H-100)/2+0'"
+    assert image.getpixel((0, 0)) == (0, 0, 0, 102)
+    assert image.getpixel((20, 30)) == (255, 255, 255, 255)